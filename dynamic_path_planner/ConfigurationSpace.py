@@ -0,0 +1,220 @@
+# ConfigurationSpace Class holds the world map with obstacles inflated by the robot footprint
+# Created by the Dynamic Path Planner contributors
+# Date: 10/19/2026
+
+# importing the necessary modules
+from .OccupancyGrid import OccupancyGrid
+from collections import OrderedDict
+import numpy as np
+import weakref
+import math
+
+# The number of rows of the map inflated at a time when the whole configuration space is computed
+strip_rows = 1024
+# The maximum number of configuration spaces kept in the cache
+configuration_space_cache_size = 8
+# The cache of configuration spaces keyed on the identity of the map and the robot footprint
+configuration_space_cache = OrderedDict()
+
+
+# Obtains the footprint of the robot as a boolean mask centred on the robot (robot_footprint is a radius or a mask)
+def footprint_mask(robot_footprint):
+    # We check if the footprint is a radius
+    if np.isscalar(robot_footprint):
+        # The number of cells the robot extends to on every side of its centre
+        radius = int(math.floor(robot_footprint))
+        # The offsets of the cells around the centre
+        dy, dx = np.mgrid[-radius:radius + 1, -radius:radius + 1]
+        # Returns the cells within the radius
+        return dy ** 2 + dx ** 2 <= robot_footprint ** 2
+    # We obtain the mask provided
+    mask = np.asarray(robot_footprint) > 0
+    # The centre of the mask must be a cell so both its dimensions need to be odd
+    if mask.ndim != 2 or mask.shape[0] % 2 == 0 or mask.shape[1] % 2 == 0:
+        raise Exception('The robot footprint mask needs odd dimensions so that it is centred on the robot')
+    # Returns the mask
+    return mask
+
+
+# Obtains the cached configuration space of the map for the robot footprint, computing it if the map object is new
+# The map isn't scanned on a lookup so a map changed in place needs invalidate_configuration_spaces (or dynamic
+# obstacles stamped through a ConfigurationSpace held by the caller)
+def get_configuration_space(map_matrix, robot_footprint):
+    # We obtain the mask of the footprint
+    mask = footprint_mask(robot_footprint)
+    # The cache key identifies both the map object and the footprint
+    key = (id(map_matrix), mask.shape, np.packbits(mask).tobytes())
+    # We check if the configuration space has already been computed for this very map object
+    entry = configuration_space_cache.get(key)
+    if entry is not None and entry[0]() is map_matrix:
+        # We mark the configuration space as the most recently used
+        configuration_space_cache.move_to_end(key)
+        # Returns the configuration space
+        return entry[1]
+    # We compute the configuration space
+    configuration_space = ConfigurationSpace(map_matrix, mask)
+    # We only cache configuration spaces of maps that can be referenced weakly as the identity of others can be reused
+    try:
+        configuration_space_cache[key] = (weakref.ref(map_matrix), configuration_space)
+    except TypeError:
+        return configuration_space
+    # We evict the least recently used configuration space if the cache is full
+    if len(configuration_space_cache) > configuration_space_cache_size:
+        configuration_space_cache.popitem(last=False)
+    # Returns the configuration space
+    return configuration_space
+
+
+# Drops the cached configuration spaces of the map (or of every map if none is given) after it was changed in place
+def invalidate_configuration_spaces(map_matrix=None):
+    # Iterating through the cached configuration spaces
+    for key, (map_reference, _) in list(configuration_space_cache.items()):
+        # We drop the configuration spaces of the map and those of maps that no longer exist
+        if map_matrix is None or map_reference() is map_matrix or map_reference() is None:
+            del configuration_space_cache[key]
+
+
+# Obtains the map a planner searches which is the configuration space stamped with the dynamic obstacles if one is given
+# and otherwise the cached configuration space of the map for the robot footprint or the map itself
+def planning_map(map_matrix, robot_footprint=None, configuration_space=None, dynamic_obstacle_list=None):
+    # We check if a configuration space was provided
+    if configuration_space is not None:
+        # We incrementally stamp the dynamic obstacles rather than inflating the whole map again
+        if dynamic_obstacle_list is not None:
+            configuration_space.update_dynamic_obstacles(dynamic_obstacle_list)
+        # Returns the configuration space with the dynamic obstacles
+        return configuration_space.c_space_map
+    # We check if the robot has a footprint
+    if robot_footprint is not None:
+        # Returns the map with obstacles inflated by the footprint
+        return get_configuration_space(map_matrix, robot_footprint).c_space_map
+    # Returns the map as it is
+    return map_matrix
+
+
+# Class ConfigurationSpace computes the cells the robot centre can occupy by dilating obstacles with its footprint
+class ConfigurationSpace(object):
+
+    # The class constructor takes in the world map and the robot footprint (a radius or a boolean mask)
+    def __init__(self, world_map, robot_footprint):
+        # We obtain the mask of the footprint
+        self.footprint = footprint_mask(robot_footprint)
+        # The footprint cells relative to the robot centre
+        self.footprint_rows = self.footprint.shape[0] // 2
+        self.footprint_columns = self.footprint.shape[1] // 2
+        # The distance beyond an obstacle that the inflated obstacle may reach
+        self.footprint_radius = max(self.footprint_rows, self.footprint_columns)
+        # A cell is blocked if the footprint placed on it overlaps an obstacle which is a dilation by the reflected mask
+        self.dilation_structure = self.footprint[::-1, ::-1]
+        # We check if the world map is an occupancy grid
+        if isinstance(world_map, OccupancyGrid):
+            # Large maps are kept by reference and inflated into a bit-packed grid
+            self.static_map = world_map
+            self.c_space_map = OccupancyGrid(world_map.shape, 'uint8' if world_map.storage == 'uint8' else 'bits')
+        else:
+            # We keep a copy of the static map so that cells freed by dynamic obstacles can be restored
+            self.static_map = (np.asarray(world_map) > 0).astype(np.uint8)
+            self.c_space_map = np.zeros(self.static_map.shape, dtype=np.uint8)
+        # We store the number of rows and columns
+        self.shape = self.c_space_map.shape
+        # The dictionary mapping the dynamic obstacles stamped into the configuration space to their extents
+        self.stamped_obstacle_dict = {}
+        # Iterating through the strips of the map
+        for row in range(0, self.shape[0], strip_rows):
+            # We inflate the obstacles of the strip
+            self._refresh_region(row, min(row + strip_rows, self.shape[0]) - 1, 0, self.shape[1] - 1)
+        # We keep the static obstacles inflated on their own so that roadmaps can grow where dynamic obstacles were
+        if isinstance(self.c_space_map, OccupancyGrid):
+            self.static_c_space_map = OccupancyGrid(self.shape, self.c_space_map.storage)
+            self.static_c_space_map.cells[...] = self.c_space_map.cells
+        else:
+            self.static_c_space_map = self.c_space_map.copy()
+        # The version is bumped every time dynamic obstacles change the configuration space
+        self.version = 0
+
+    # This function recomputes the inflated obstacles within the rows and columns specified (inclusive)
+    def _refresh_region(self, min_row, max_row, min_column, max_column):
+        # We clip the region to the map
+        min_row = max(min_row, 0)
+        max_row = min(max_row, self.shape[0] - 1)
+        min_column = max(min_column, 0)
+        max_column = min(max_column, self.shape[1] - 1)
+        # We can't refresh a region that lies outside the map
+        if min_row > max_row or min_column > max_column:
+            return
+        # The obstacles within a footprint of the region can be inflated into it
+        window_min_row = max(min_row - self.footprint_rows, 0)
+        window_max_row = min(max_row + self.footprint_rows, self.shape[0] - 1)
+        window_min_column = max(min_column - self.footprint_columns, 0)
+        window_max_column = min(max_column + self.footprint_columns, self.shape[1] - 1)
+        # We obtain the static obstacles of the window
+        obstacles = np.asarray(self.static_map[window_min_row:window_max_row + 1,
+                                               window_min_column:window_max_column + 1]) == 0
+        # Iterating through the dynamic obstacles stamped into the configuration space
+        for dynamic_obstacle, extents in self.stamped_obstacle_dict.values():
+            # We skip obstacles that don't overlap the window
+            if (extents[0] > window_max_row or extents[1] < window_min_row or
+                    extents[2] > window_max_column or extents[3] < window_min_column):
+                continue
+            # We obtain the coordinates of the obstacle relative to the window
+            coordinates = np.array(dynamic_obstacle.obstacle_coordinate_list).reshape(-1, 2) - (window_min_row,
+                                                                                                 window_min_column)
+            # We keep the coordinates within the window
+            coordinates = coordinates[(coordinates[:, 0] >= 0) & (coordinates[:, 0] < obstacles.shape[0]) &
+                                      (coordinates[:, 1] >= 0) & (coordinates[:, 1] < obstacles.shape[1])]
+            # We mark the coordinates as obstacles
+            obstacles[coordinates[:, 0], coordinates[:, 1]] = True
+        # We import scipy on first use as it is slow to load
+        from scipy.ndimage import binary_dilation
+        # We inflate the obstacles by the footprint (the map boundary itself is not treated as an obstacle)
+        inflated = binary_dilation(obstacles, structure=self.dilation_structure)
+        # We write the cells of the region that the robot centre can occupy
+        self.c_space_map[min_row:max_row + 1, min_column:max_column + 1] = ~inflated[
+            min_row - window_min_row:max_row - window_min_row + 1,
+            min_column - window_min_column:max_column - window_min_column + 1]
+
+    # This function stamps new dynamic obstacles into the configuration space and clears the ones that were removed
+    def update_dynamic_obstacles(self, dynamic_obstacle_list):
+        # The regions around obstacles that were stamped or cleared
+        changed_region_list = []
+        # The dictionary of the current dynamic obstacles
+        current_obstacle_dict = {id(dynamic_obstacle): dynamic_obstacle for dynamic_obstacle in dynamic_obstacle_list}
+        # Iterating through the obstacles stamped earlier
+        for key, (dynamic_obstacle, extents) in list(self.stamped_obstacle_dict.items()):
+            # We clear obstacles that were removed or that have changed since they were stamped
+            if (key not in current_obstacle_dict or not dynamic_obstacle.obstacle_coordinate_list or
+                    extents != self._obstacle_extents(dynamic_obstacle)):
+                # We remove the obstacle from the stamped obstacles
+                del self.stamped_obstacle_dict[key]
+                # The region the obstacle covered has to be refreshed
+                changed_region_list.append(extents)
+        # Iterating through the current obstacles
+        for key, dynamic_obstacle in current_obstacle_dict.items():
+            # We stamp obstacles that aren't stamped yet
+            if key not in self.stamped_obstacle_dict and dynamic_obstacle.obstacle_coordinate_list:
+                # We obtain the extents of the obstacle
+                extents = self._obstacle_extents(dynamic_obstacle)
+                # We add the obstacle to the stamped obstacles
+                self.stamped_obstacle_dict[key] = (dynamic_obstacle, extents)
+                # The region the obstacle covers has to be refreshed
+                changed_region_list.append(extents)
+        # Iterating through the changed regions
+        for extents in changed_region_list:
+            # The inflated obstacle reaches a footprint beyond the obstacle itself
+            self._refresh_region(extents[0] - self.footprint_rows, extents[1] + self.footprint_rows,
+                                 extents[2] - self.footprint_columns, extents[3] + self.footprint_columns)
+        # We bump the version if the configuration space changed
+        if changed_region_list:
+            self.version += 1
+        # Returns whether the configuration space changed
+        return len(changed_region_list) > 0
+
+    # This function obtains the extents (min_y, max_y, min_x, max_x, coordinate count) of a dynamic obstacle
+    @staticmethod
+    def _obstacle_extents(dynamic_obstacle):
+        # We obtain the y and x coordinates of the obstacle
+        y_coordinates = [item[0] for item in dynamic_obstacle.obstacle_coordinate_list]
+        x_coordinates = [item[1] for item in dynamic_obstacle.obstacle_coordinate_list]
+        # The coordinate count detects obstacles that grew without changing their ranges
+        return (min(y_coordinates), max(y_coordinates), min(x_coordinates), max(x_coordinates),
+                len(dynamic_obstacle.obstacle_coordinate_list))
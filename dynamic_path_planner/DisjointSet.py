@@ -0,0 +1,60 @@
+# DisjointSet Class holds the connected components of a graph via union-find
+# Created by the Dynamic Path Planner contributors
+# Date: 10/19/2026
+
+
+# Class DisjointSet tracks which items are connected with path compression and union by rank
+class DisjointSet(object):
+
+    # The class constructor takes in an optional list of items that start out in their own components
+    def __init__(self, item_list=()):
+        # The parent of every item (roots are their own parents)
+        self.parent = {}
+        # The rank of every root which bounds the depth of its tree
+        self.rank = {}
+        # Iterating through the items provided
+        for item in item_list:
+            # We add the item as its own component
+            self.add(item)
+
+    # This function adds an item as its own component if it isn't already present
+    def add(self, item):
+        # We check if the item is new
+        if item not in self.parent:
+            # The item is its own parent
+            self.parent[item] = item
+            # A single item tree has zero rank
+            self.rank[item] = 0
+
+    # This function obtains the root that labels the component of the item
+    def find(self, item):
+        # We locate the root of the item
+        root = item
+        while self.parent[root] != root:
+            root = self.parent[root]
+        # We compress the path so that later lookups are constant time
+        while self.parent[item] != root:
+            self.parent[item], item = root, self.parent[item]
+        # Returns the root of the component
+        return root
+
+    # This function merges the components of two items
+    def union(self, item_1, item_2):
+        # We obtain the roots of both items
+        root_1 = self.find(item_1)
+        root_2 = self.find(item_2)
+        # The items are already in the same component
+        if root_1 == root_2:
+            return
+        # We attach the shallower tree below the deeper one
+        if self.rank[root_1] < self.rank[root_2]:
+            root_1, root_2 = root_2, root_1
+        self.parent[root_2] = root_1
+        # The rank only grows when both trees are equally deep
+        if self.rank[root_1] == self.rank[root_2]:
+            self.rank[root_1] += 1
+
+    # This function checks whether two items are in the same component
+    def connected(self, item_1, item_2):
+        # Items sharing a root are connected
+        return self.find(item_1) == self.find(item_2)
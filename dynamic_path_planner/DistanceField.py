@@ -0,0 +1,158 @@
+# DistanceField Class holds the cost-to-go from a single goal to every free cell so that many starts share one search
+# Created by the Dynamic Path Planner contributors
+# Date: 10/19/2026
+
+# importing the necessary modules
+from .ConfigurationSpace import planning_map
+from .grid_graph import free_space_mask, map_fingerprint, grid_distances
+from collections import OrderedDict
+import numpy as np
+import weakref
+import time
+import math
+
+# The maximum number of distance fields held in the cache
+distance_field_cache_size = 8
+# The cache of distance fields keyed on the identity and version of the map and the goal
+distance_field_cache = OrderedDict()
+# The eight neighbour positions to consider and their step costs (the same as those of A*)
+neighbor_steps = [(dy, dx, math.sqrt(dy ** 2 + dx ** 2)) for dy in (-1, 0, 1) for dx in (-1, 0, 1) if dy or dx]
+
+
+# Obtains the cached distance field towards the goal over the map, computing it if the map, its version or goal is new
+# The map isn't scanned on a lookup so find_path checks the path it extracts against the map to catch in place changes
+def get_distance_field(map_matrix, goal, map_version=0):
+    # The cache key identifies the map object, its version and the goal
+    key = (id(map_matrix), map_version, (int(goal[0]), int(goal[1])))
+    # We check if the distance field has already been computed for this very map object
+    entry = distance_field_cache.get(key)
+    if entry is not None and entry[0]() is map_matrix:
+        # We mark the distance field as the most recently used
+        distance_field_cache.move_to_end(key)
+        # Returns the distance field
+        return entry[1]
+    # We compute the distance field
+    distance_field = DistanceField(map_matrix, goal)
+    # We only cache fields of maps that can be referenced weakly as the identity of other maps can be reused
+    try:
+        distance_field_cache[key] = (weakref.ref(map_matrix), distance_field)
+    except TypeError:
+        return distance_field
+    # We evict the least recently used distance field if the cache is full
+    if len(distance_field_cache) > distance_field_cache_size:
+        distance_field_cache.popitem(last=False)
+    # Returns the distance field
+    return distance_field
+
+
+# Drops the cached distance fields of the map (or of every map if none is given) after it was changed in place
+def invalidate_distance_fields(map_matrix=None):
+    # Iterating through the cached distance fields
+    for key, (map_reference, _) in list(distance_field_cache.items()):
+        # We drop the fields of the map and those of maps that no longer exist
+        if map_matrix is None or map_reference() is map_matrix or map_reference() is None:
+            del distance_field_cache[key]
+
+
+# Finds the shortest path by descending the cached distance field of the goal (unlike A* the path runs start to goal)
+# robot_footprint is an optional robot radius or footprint mask against whose cached configuration space we plan
+# configuration_space is an optional ConfigurationSpace of the static map into which dynamic_obstacle_list is stamped
+# map_version identifies the state of a map changed in place (the version of the configuration space is used if given)
+# and saves recomputing a field whose path runs into a new obstacle (the field is recomputed if it does) while cells
+# freed in place only leave the path longer than needed until the version changes or the fields are invalidated
+def find_path(map_matrix, start, goal, robot_footprint=None, configuration_space=None, dynamic_obstacle_list=None,
+              map_version=0):
+    # We measure the time at start
+    start_time = time.time()
+    # We plan over the map with obstacles inflated by the footprint if the robot has one
+    map_matrix = planning_map(map_matrix, robot_footprint, configuration_space, dynamic_obstacle_list)
+    # The configuration space counts its own changes
+    if configuration_space is not None:
+        map_version = configuration_space.version
+    # We obtain the distance field towards the goal
+    distance_field = get_distance_field(map_matrix, goal, map_version)
+    # We descend the distance field from the start checking every step against the map
+    path, path_length = distance_field.extract_path(start, map_matrix)
+    # A step onto an obstacle shows that the map changed in place since the field was computed
+    if path is None:
+        # We drop the stale fields of the map and compute the field again
+        invalidate_distance_fields(map_matrix)
+        distance_field = get_distance_field(map_matrix, goal, map_version)
+        path, path_length = distance_field.extract_path(start)
+    # We measure the time to perform the path planning
+    end_time = time.time()
+    # Returns the path, path length, computation time and the distance field used
+    return path, path_length, end_time-start_time, distance_field
+
+
+# Class DistanceField computes the exact grid distance to the goal from every free cell in a single dijkstra sweep
+class DistanceField(object):
+
+    # The class constructor computes the distance field of the goal over the map (obstacles are zeros)
+    def __init__(self, map_matrix, goal):
+        # We store the goal
+        self.goal = (int(goal[0]), int(goal[1]))
+        # We obtain the free space of the map
+        free_mask = free_space_mask(map_matrix)
+        # We store the fingerprint of the map against which the field was computed
+        self.fingerprint = map_fingerprint(free_mask)
+        # We check that the goal lies in the free space of the map
+        if not (0 <= self.goal[0] < free_mask.shape[0] and 0 <= self.goal[1] < free_mask.shape[1] and
+                free_mask[self.goal]):
+            # Every cell is unreachable from a goal over an obstacle
+            self.cost_to_go = np.full(free_mask.shape, np.inf, dtype=np.float32)
+        else:
+            # The distance field holds the cost-to-go of every cell (unreachable cells are infinite)
+            self.cost_to_go = grid_distances(free_mask, [self.goal])[0]
+
+    # This function checks whether the distance field was computed against the given map
+    def is_valid_for(self, map_matrix):
+        # The field is only valid if the free space of the map is unchanged
+        return map_fingerprint(map_matrix) == self.fingerprint
+
+    # This function obtains the path from the start to the goal by always stepping to the neighbour closest to the goal
+    # If map_matrix is given every cell of the path is checked against it and None is returned if one is an obstacle
+    def extract_path(self, start, map_matrix=None):
+        # We obtain the number of rows and columns in the map
+        rows, columns = self.cost_to_go.shape
+        # We represent the start as a coordinate tuple
+        current_coordinate = (int(start[0]), int(start[1]))
+        # We check if the start lies outside the map or can't reach the goal
+        if (not (0 <= current_coordinate[0] < rows and 0 <= current_coordinate[1] < columns) or
+                np.isinf(self.cost_to_go[current_coordinate])):
+            # We return an empty array to show that there isn't a path and infinity
+            return [], float('Inf')
+        # The start must still be free in the map
+        if map_matrix is not None and map_matrix[current_coordinate[0], current_coordinate[1]] <= 0:
+            return None, None
+        # The path begins at the start
+        path = [current_coordinate]
+        # The length of the path walked so far
+        path_length = 0
+        # Each step strictly lowers the cost-to-go so the descent ends at the goal in as many steps as the path has
+        while current_coordinate != self.goal:
+            # The neighbour through which the remaining path is shortest and the cost via it
+            best_neighbor = None
+            best_cost = float('Inf')
+            best_step = 0
+            # Iterating through the possible neighbours
+            for dy, dx, step in neighbor_steps:
+                # Getting the neighbour coordinate
+                neighbor = (current_coordinate[0] + dy, current_coordinate[1] + dx)
+                # We skip neighbours that lie outside the map
+                if not (0 <= neighbor[0] < rows and 0 <= neighbor[1] < columns):
+                    continue
+                # The cost of reaching the goal through the neighbour (obstacles are infinite)
+                neighbor_cost = step + self.cost_to_go[neighbor]
+                # We check if this is the best neighbour so far
+                if neighbor_cost < best_cost:
+                    best_neighbor, best_cost, best_step = neighbor, neighbor_cost, step
+            # The field is stale if the best neighbour has become an obstacle
+            if map_matrix is not None and map_matrix[best_neighbor[0], best_neighbor[1]] <= 0:
+                return None, None
+            # We step to the best neighbour
+            current_coordinate = best_neighbor
+            path.append(current_coordinate)
+            path_length += best_step
+        # Returns the path (from start to goal) and its length
+        return path, path_length
@@ -0,0 +1,727 @@
+# Integrated PRM Technique
+# Created by Ashwin Vinoo
+# Date: 3/9/2019
+
+# importing the necessary modules
+from .RoadmapEdge import RoadmapEdge
+from .DisjointSet import DisjointSet
+from .NodeGridIndex import NodeGridIndex
+from .OccupancyGrid import count_free_cells
+from .ConfigurationSpace import ConfigurationSpace
+from .rrt import check_hit
+from .grid_graph import a_star_path
+from collections import OrderedDict
+import numpy as np
+import weakref
+import random
+import copy
+import heapq
+import math
+import time
+
+
+# Class Integrated_PRM contains the functionality needed to implement the Integrated PRM path planning algorithm
+class IntegratedPRM(object):
+
+    # mode can be 'density' or 'count' that applies to node_value and node_neighbors is the K-nearest neighbors for them
+    # auto_densify_attempts is the number of times a failed query densifies the roadmap around its start and goal
+    # auto_densify_node_budget is the total number of nodes failed queries may add (None allows the initial node count)
+    # robot_footprint is an optional robot radius or footprint mask by which the obstacles are inflated
+    # spanner_stretch is an optional factor by which the roadmap is pruned while bounding the stretch of its paths
+    # path_cache_size is the number of roadmap paths kept for repeated queries (zero disables the cache)
+    def __init__(self, world_map, mode='density', node_value=10, node_neighbors=10, max_neighbor_distance=0.5,
+                 auto_densify_attempts=0, robot_footprint=None, spanner_stretch=None, path_cache_size=0,
+                 auto_densify_node_budget=None):
+
+        # ----------- world map settings and initializations -----------
+
+        # The configuration space holding the obstacles inflated by the robot footprint
+        self.configuration_space = None
+        # The distance by which the obstacles are inflated
+        self.obstacle_margin = 0
+        # We check if the robot has a footprint
+        if robot_footprint is not None:
+            # We compute the configuration space once so that every collision check runs against it
+            self.configuration_space = ConfigurationSpace(world_map, robot_footprint)
+            self.obstacle_margin = self.configuration_space.footprint_radius
+            # The roadmap is built and grown over the static obstacles inflated (dynamic ones only block edges)
+            world_map = self.configuration_space.static_c_space_map
+        # Initializes the world map with that provided
+        self.world_map = world_map
+        # Obtains the number of rows in the world map
+        self.world_map_rows = world_map.shape[0]
+        # Obtains the number of columns in the world map
+        self.world_map_columns = world_map.shape[1]
+
+        # Initialize the number of world map nodes to be zero
+        self.roadmap_nodes = 0
+        # Check whether the number of roadmap nodes is 'auto' and not a fixed number
+        if mode == 'density':
+            # We obtain the number of roadmap nodes
+            self.roadmap_nodes = int(count_free_cells(world_map)/(node_value**2))
+            # The node density is the average spacing between nodes
+            self.node_spacing = node_value
+            # We also change the max_neighbor_distance from density form to actual distance
+            max_neighbor_distance = max_neighbor_distance * (self.world_map_rows + self.world_map_columns)/2
+        else:
+            # We directly use the number of roadmap nodes provided by the user
+            self.roadmap_nodes = node_value
+            # We obtain the average spacing between nodes from the free space they share
+            self.node_spacing = math.sqrt(count_free_cells(world_map)/max(node_value, 1))
+        # We store the number of neighbors and the maximum distance between connected nodes
+        self.node_neighbors = node_neighbors
+        self.max_neighbor_distance = max_neighbor_distance
+        # We store the number of times failed queries may densify the roadmap
+        self.auto_densify_attempts = auto_densify_attempts
+        # The dynamic obstacles and map against which the edges were last checked for blockage
+        self.dynamic_obstacle_list = []
+        self.blockage_world_map = world_map
+        # The maximum number of roadmap paths held in the cache
+        self.path_cache_size = path_cache_size
+        # The cache of roadmap paths keyed on the attached roadmap nodes and the roadmap version
+        self.path_cache = OrderedDict()
+        # The dictionary mapping the edges used by cached paths to the keys of those paths
+        self.path_cache_edge_dict = {}
+        # The roadmap version changes whenever an edge becomes usable so that cached paths may no longer be shortest
+        self.roadmap_version = 0
+
+        # ----------- Adding nodes to the world map  -----------
+
+        # We initialize the node list to be empty
+        self.roadmap_node_list = []
+        # We create a node dictionary that maps nodes to nodes and the distances between them
+        self.roadmap_nodes_and_edge_dict = {}
+        # We iterate through a while loop until we have randomly placed in all required nodes
+        while len(self.roadmap_node_list) < self.roadmap_nodes:
+            # We obtain a random row number
+            random_row = random.randint(0, self.world_map_rows-1)
+            # We obtain a random column number
+            random_column = random.randint(0, self.world_map_columns-1)
+            # Check if there is an static obstacle in world map at that point and if the coordinate is already listed
+            if world_map[random_row, random_column] > 0 and (random_row, random_column) not in self.roadmap_node_list:
+                # The roadmap node list is appended with the random coordinate
+                self.roadmap_node_list.append((random_row, random_column))
+                # We set the roadmap node to node dictionary at that coordinate to an empty list
+                self.roadmap_nodes_and_edge_dict[(random_row, random_column)] = []
+
+        # ----------- Creating edges using K nearest neighbors algorithm  -----------
+
+        # We import sklearn on first use as it is slow to load
+        from sklearn.neighbors import NearestNeighbors
+        # We create an instance of the K nearest neighbors algorithm and fit it to handle the node list
+        knn_algorithm = NearestNeighbors(n_neighbors=node_neighbors+1,
+                                         algorithm='ball_tree').fit(self.roadmap_node_list)
+        # We obtain the distances and indices to the K nearest neighbors of each node
+        distances, indices = knn_algorithm.kneighbors(self.roadmap_node_list)
+        # The list containing the edges of the roadmap
+        self.roadmap_edge_list = []
+        # Create a dictionary to map nodes that become part of an edge as true
+        roadmap_node_list_dict = {}
+        # Iterating through the rows of the indices where row number is index of current node in node list
+        for i in range(len(self.roadmap_node_list)):
+            # We obtain the indices of the nodes that link to the node at index i in the roadmap node list
+            node_indices = indices[i][1:]
+            # We iterate through indices of the nearest nodes associated with the current node
+            for j in range(len(node_indices)):
+                # We only consider indices greater than that of the current node to ensure repeats don't occur
+                if (node_indices[j] > i and distances[i][j+1] <= max_neighbor_distance and
+                        # We check if distance constraints are met and if adjacent nodes collide
+                        not check_hit(world_map, self.roadmap_node_list[i], self.roadmap_node_list[node_indices[j]])):
+
+                    # We create the new roadmap edge object
+                    edge_object = RoadmapEdge(self.roadmap_node_list[i], self.roadmap_node_list[node_indices[j]],
+                                              distances[i][j+1])
+                    # We append the created roadmap edge object to the roadmap list
+                    self.roadmap_edge_list.append(edge_object)
+
+                    # We update the node to node dictionary for the first coordinate
+                    self.roadmap_nodes_and_edge_dict[
+                        self.roadmap_node_list[i]].append([self.roadmap_node_list[node_indices[j]], edge_object])
+                    # We update the node to node dictionary for the second coordinate
+                    self.roadmap_nodes_and_edge_dict[
+                        self.roadmap_node_list[node_indices[j]]].append([self.roadmap_node_list[i], edge_object])
+
+                    # We mark these nodes as true in the dictionary
+                    roadmap_node_list_dict[self.roadmap_node_list[i]] = True
+                    roadmap_node_list_dict[self.roadmap_node_list[node_indices[j]]] = True
+
+        # ----------- Eliminating all nodes that do not have any connection to an edge -----------
+
+        # Create a list to hold nodes that have a connection to an edge
+        roadmap_node_list_edged = []
+        # Iterating through the nodes in the node list
+        for node in self.roadmap_node_list:
+            # We check if that node has been marked as true in the dictionary
+            if roadmap_node_list_dict.get(node, False):
+                # Append the node onto the edged node list
+                roadmap_node_list_edged.append(node)
+        # We copy the edged nodes into the roadmap node list
+        self.roadmap_node_list = roadmap_node_list_edged
+
+        # ----------- Labelling the connected components of the roadmap -----------
+
+        # By default failed queries may at most double the number of nodes in the roadmap
+        self.auto_densify_node_budget = (len(self.roadmap_node_list) if auto_densify_node_budget is None
+                                         else auto_densify_node_budget)
+        # The number of nodes failed queries have added so far
+        self.auto_densified_node_count = 0
+        # The labels of the free regions of the map failed queries were last checked against with the map and version
+        self.map_label_cache = None
+        # We index the nodes in buckets so that nodes can be searched and added without rebuilding the roadmap
+        self.roadmap_index = NodeGridIndex(self.node_spacing, self.roadmap_node_list)
+        # We label the components of the roadmap connected via edges that aren't blocked
+        self.update_roadmap_components()
+
+        # ----------- Pruning the roadmap into a sparse spanner -----------
+
+        # The edges removed, nodes removed and observed stretch of the pruning if it was requested
+        self.spanner_statistics = None
+        # We check if the roadmap should be pruned
+        if spanner_stretch is not None:
+            # We prune the redundant edges of the roadmap
+            self.spanner_statistics = self.sparsify(spanner_stretch)
+
+    # This function labels the connected components of the roadmap from scratch via union-find
+    def update_roadmap_components(self):
+        # Every node starts out in its own component
+        self.roadmap_components = DisjointSet(self.roadmap_node_list)
+        # We iterate through the edges of the roadmap
+        for edge in self.roadmap_edge_list:
+            # Only edges that aren't blocked connect their nodes
+            if not edge.dynamic_obstacle_overlap:
+                # We merge the components of both nodes
+                self.roadmap_components.union(edge.vertex_1, edge.vertex_2)
+
+    # This function empties the path cache and moves to a new roadmap version
+    def clear_path_cache(self):
+        # Cached paths may no longer be the shortest once edges are added or unblocked
+        self.roadmap_version += 1
+        # We empty the cache
+        self.path_cache.clear()
+        self.path_cache_edge_dict.clear()
+
+    # This function removes a cached path and its key from the index of every edge it uses
+    def remove_cached_path(self, key):
+        # We remove the path from the cache
+        _, _, edge_id_list = self.path_cache.pop(key)
+        # Iterating through the edges of the path
+        for edge_id in edge_id_list:
+            # We remove the key from the index of the edge and drop the edge once no cached path uses it
+            key_set = self.path_cache_edge_dict.get(edge_id)
+            if key_set is not None:
+                key_set.discard(key)
+                if not key_set:
+                    del self.path_cache_edge_dict[edge_id]
+
+    # This function evicts the cached paths that travel along the edge
+    def evict_cached_paths(self, edge):
+        # Iterating through the keys of the cached paths that use the edge
+        for key in list(self.path_cache_edge_dict.get(id(edge), ())):
+            # We remove the path along with its keys in the index of its other edges
+            self.remove_cached_path(key)
+
+    # This function adds a roadmap path (from start node to goal node) and its length to the cache
+    def cache_path(self, key, node_path, path_length):
+        # We obtain the edges along the path
+        edge_list = []
+        # Iterating through the consecutive nodes of the path
+        for node, next_node in zip(node_path[:-1], node_path[1:]):
+            # We find the edge connecting the nodes
+            for connect_node, edge_object in self.roadmap_nodes_and_edge_dict[node]:
+                if connect_node == next_node and not edge_object.dynamic_obstacle_overlap:
+                    edge_list.append(edge_object)
+                    break
+        # We replace any path already cached under the key
+        if key in self.path_cache:
+            self.remove_cached_path(key)
+        # We store the path, its length and the edges it uses so that the index can be cleaned up on eviction
+        self.path_cache[key] = (node_path, path_length, [id(edge_object) for edge_object in edge_list])
+        # We record the path against every edge it uses so that blocking the edge evicts only dependent paths
+        for edge_object in edge_list:
+            self.path_cache_edge_dict.setdefault(id(edge_object), set()).add(key)
+        # We evict the least recently used path if the cache is full
+        if len(self.path_cache) > self.path_cache_size:
+            self.remove_cached_path(next(iter(self.path_cache)))
+
+    # This function checks whether the edges of the roadmap are blocked or not and keeps the components up to date
+    def update_edge_list_for_blockage(self, dynamic_obstacle_list, world_map):
+        # We store the dynamic obstacles and map so that edges added later can be checked against them
+        self.dynamic_obstacle_list = dynamic_obstacle_list
+        self.blockage_world_map = world_map
+        # We mark whether any edge has become blocked
+        edge_newly_blocked = False
+        # The list of edges that are no longer blocked
+        edges_newly_unblocked = []
+        # We iterate through the edges of the roadmap
+        for edge in self.roadmap_edge_list:
+            # We store the previous edge status
+            edge_was_blocked = edge.dynamic_obstacle_overlap
+            # We update the edge status
+            edge.update_edge_blockage(dynamic_obstacle_list, world_map, self.obstacle_margin)
+            # We check if the edge status has changed
+            if edge.dynamic_obstacle_overlap and not edge_was_blocked:
+                edge_newly_blocked = True
+                # Only the cached paths that use the edge are affected
+                self.evict_cached_paths(edge)
+            elif edge_was_blocked and not edge.dynamic_obstacle_overlap:
+                edges_newly_unblocked.append(edge)
+        # Unblocked edges may shorten any path so the cache is emptied
+        if edges_newly_unblocked:
+            self.clear_path_cache()
+        # Union-find can't split components so blocked edges require the components to be labelled again
+        if edge_newly_blocked:
+            self.update_roadmap_components()
+        else:
+            # Unblocked edges can simply merge the components of their nodes
+            for edge in edges_newly_unblocked:
+                self.roadmap_components.union(edge.vertex_1, edge.vertex_2)
+
+    # This function updates the edges blocked by the dynamic obstacles and returns the map that queries run against
+    def refresh_blockage(self, map_matrix, dynamic_obstacle_list):
+        # We check if the robot has a footprint
+        if self.configuration_space is not None:
+            # We incrementally stamp the inflated dynamic obstacles into the configuration space
+            self.configuration_space.update_dynamic_obstacles(dynamic_obstacle_list)
+            # Every collision check runs against the configuration space
+            map_matrix = self.configuration_space.c_space_map
+        # We update the edges which are blocked by dynamic obstacles
+        self.update_edge_list_for_blockage(dynamic_obstacle_list, map_matrix)
+        # Returns the map
+        return map_matrix
+
+    # This function finds the closest visible roadmap node to the coordinate in every nearby component
+    def find_roadmap_attachments(self, map_matrix, coordinate):
+        # The dictionary mapping component labels to the attached node and its distance
+        attachments = {}
+        # The dictionary counting the nodes of every component that weren't visible
+        hidden_node_count = {}
+        # Iterating through the roadmap nodes in order of their distance to the coordinate
+        for distance, node in self.roadmap_index.nearest_nodes(coordinate):
+            # Beyond the neighbor distance we only keep searching until any node has been attached
+            if attachments and distance > self.max_neighbor_distance:
+                break
+            # We obtain the component of the roadmap node
+            component = self.roadmap_components.find(node)
+            # We skip components that already have a closer node attached
+            if component in attachments:
+                continue
+            # Once any node is attached we only try the closest few nodes of the other components
+            if attachments and hidden_node_count.get(component, 0) >= self.node_neighbors:
+                continue
+            # We check if the node is visible from the coordinate
+            if not check_hit(map_matrix, coordinate, node):
+                # We attach the coordinate to the node for this component
+                attachments[component] = (node, distance)
+            else:
+                # We count the hidden node against its component
+                hidden_node_count[component] = hidden_node_count.get(component, 0) + 1
+        # Returns the attachments
+        return attachments
+
+    # This function inserts new nodes into the roadmap and connects them to their K nearest nodes in place
+    def add_nodes(self, node_list):
+        # The list of nodes that were added to the roadmap
+        added_node_list = []
+        # Iterating through the nodes to be added
+        for node in node_list:
+            # We represent the node as a coordinate tuple
+            node = (int(node[0]), int(node[1]))
+            # We skip nodes that lie outside the map, over static obstacles or that are already edged in the roadmap
+            if (not (0 <= node[0] < self.world_map_rows and 0 <= node[1] < self.world_map_columns) or
+                    self.world_map[node[0], node[1]] <= 0 or self.roadmap_nodes_and_edge_dict.get(node)):
+                continue
+            # The list of edges that connect the node to the roadmap
+            node_edge_list = []
+            # Iterating through the K nearest roadmap nodes within the neighbor distance
+            for distance, neighbor in self.roadmap_index.k_nearest(node, self.node_neighbors,
+                                                                   self.max_neighbor_distance):
+                # We check if adjacent nodes collide
+                if not check_hit(self.world_map, node, neighbor):
+                    # We create the new roadmap edge object
+                    edge_object = RoadmapEdge(node, neighbor, distance)
+                    # We check the new edge against the dynamic obstacles the roadmap was last updated with
+                    edge_object.update_edge_blockage(self.dynamic_obstacle_list, self.blockage_world_map,
+                                                     self.obstacle_margin)
+                    # We add the edge to the list of edges of the node
+                    node_edge_list.append(edge_object)
+            # Like during construction, nodes that do not have any connection to an edge are dropped
+            if not node_edge_list:
+                continue
+            # The node starts out in its own component
+            self.roadmap_components.add(node)
+            # We set the roadmap node to node dictionary at that coordinate to an empty list
+            self.roadmap_nodes_and_edge_dict[node] = []
+            # Iterating through the edges of the node
+            for edge_object in node_edge_list:
+                # We append the created roadmap edge object to the roadmap list
+                self.roadmap_edge_list.append(edge_object)
+                # We update the node to node dictionary for both coordinates
+                self.roadmap_nodes_and_edge_dict[node].append([edge_object.vertex_2, edge_object])
+                self.roadmap_nodes_and_edge_dict[edge_object.vertex_2].append([node, edge_object])
+                # Edges that aren't blocked merge the components of their nodes
+                if not edge_object.dynamic_obstacle_overlap:
+                    self.roadmap_components.union(node, edge_object.vertex_2)
+            # We add the node to the roadmap node list and the index
+            self.roadmap_node_list.append(node)
+            self.roadmap_index.add(node)
+            added_node_list.append(node)
+        # New edges may shorten any path so the cache is emptied
+        if added_node_list:
+            self.clear_path_cache()
+        # Returns the nodes that were added
+        return added_node_list
+
+    # This function samples extra nodes inside the region [(y1, x1), (y2, x2)] and adds them to the roadmap
+    # node_limit optionally caps the number of nodes sampled whichever way node_count was obtained
+    def densify(self, region, node_count=None, node_limit=None):
+        # We clip the region to the world map
+        min_row = max(min(region[0][0], region[1][0]), 0)
+        max_row = min(max(region[0][0], region[1][0]), self.world_map_rows-1)
+        min_column = max(min(region[0][1], region[1][1]), 0)
+        max_column = min(max(region[0][1], region[1][1]), self.world_map_columns-1)
+        # We can't densify a region that lies outside the world map
+        if min_row > max_row or min_column > max_column:
+            return []
+        # We obtain the number of free cells in the region
+        free_cells = count_free_cells(self.world_map[min_row:max_row+1, min_column:max_column+1])
+        # By default the region is densified to half the node spacing of the roadmap
+        if node_count is None:
+            node_count = int(math.ceil(free_cells/((self.node_spacing/2)**2)))
+        # We can't place more nodes than there are free cells or the limit allows
+        node_count = min(node_count, free_cells, node_limit if node_limit is not None else node_count)
+        # The list of sampled nodes
+        sampled_node_list = []
+        # We limit the number of attempts in case the region is mostly covered by obstacles
+        for _ in range(100 * node_count):
+            # We stop once we have sampled enough nodes
+            if len(sampled_node_list) >= node_count:
+                break
+            # We obtain a random coordinate in the region
+            random_row = random.randint(min_row, max_row)
+            random_column = random.randint(min_column, max_column)
+            # Check if there is an static obstacle in world map at that point
+            if self.world_map[random_row, random_column] > 0:
+                # We add the coordinate to the sampled nodes
+                sampled_node_list.append((random_row, random_column))
+        # Returns the nodes that were added to the roadmap
+        return self.add_nodes(sampled_node_list)
+
+    # This function adds nodes along the free space route from start to goal over the map and returns them
+    # Consecutive nodes see each other and lie close enough to be edged so the route bridges any narrow passage
+    def densify_route(self, map_matrix, start, goal, node_limit=None):
+        # We import the planner on first use
+        from . import a_star
+        # We find the route over the map
+        route, route_length = a_star.find_path(map_matrix, start, goal)[:2]
+        # There is nothing to densify if the map has no route
+        if route_length == float('Inf'):
+            return []
+        # We obtain the route from start to goal
+        route = a_star_path(map_matrix, route, start, goal)
+        # Nodes are placed no further apart than the roadmap spacing and the neighbor distance
+        step = max(min(self.node_spacing, self.max_neighbor_distance), 1)
+        # The list of nodes along the route
+        waypoint_list = []
+        # The node the next one is placed from
+        last_waypoint = route[0]
+        # Iterating through the route
+        for index in range(1, len(route) - 1):
+            # We place a node where the next cell would be too far from or hidden from the last node
+            next_cell = route[index + 1]
+            if (math.hypot(next_cell[0] - last_waypoint[0], next_cell[1] - last_waypoint[1]) > step or
+                    check_hit(map_matrix, last_waypoint, next_cell)):
+                last_waypoint = route[index]
+                waypoint_list.append(last_waypoint)
+        # Returns the nodes that were added to the roadmap
+        return self.add_nodes(waypoint_list[:node_limit] if node_limit is not None else waypoint_list)
+
+    # This function prunes the roadmap into a greedy spanner whose paths are at most stretch_factor times longer
+    def sparsify(self, stretch_factor):
+        # The stretch factor can't allow paths shorter than those of the full roadmap
+        if stretch_factor < 1:
+            raise Exception('The stretch factor of the spanner must be at least one')
+        # The adjacency of the spanner as a dictionary mapping nodes to lists of connected nodes and edge lengths
+        spanner_dict = {node: [] for node in self.roadmap_node_list}
+        # The list of edges kept in the spanner
+        spanner_edge_list = []
+        # The largest ratio between the spanner distance and the length of a removed edge
+        observed_stretch = 1.0
+        # Visiting the edges from the shortest ensures the spanner keeps the short edges paths are built from
+        for edge in sorted(self.roadmap_edge_list, key=lambda roadmap_edge: roadmap_edge.edge_length):
+            # We obtain the distance between the nodes of the edge within the spanner built so far
+            spanner_distance = self._bounded_distance(spanner_dict, edge.vertex_1, edge.vertex_2,
+                                                      stretch_factor * edge.edge_length)
+            # The edge is redundant if the spanner already connects its nodes within the stretch factor
+            if spanner_distance <= stretch_factor * edge.edge_length:
+                # We track the stretch caused by removing the edge
+                observed_stretch = max(observed_stretch, float(spanner_distance / max(edge.edge_length, 1e-9)))
+                continue
+            # We keep the edge in the spanner
+            spanner_edge_list.append(edge)
+            spanner_dict[edge.vertex_1].append((edge.vertex_2, edge.edge_length))
+            spanner_dict[edge.vertex_2].append((edge.vertex_1, edge.edge_length))
+        # We obtain the number of edges removed
+        edges_removed = len(self.roadmap_edge_list) - len(spanner_edge_list)
+        # The set of edges kept in the spanner
+        spanner_edge_set = set(id(edge) for edge in spanner_edge_list)
+        # Iterating through the nodes of the roadmap
+        for node in self.roadmap_node_list:
+            # We only keep the connections whose edges are in the spanner
+            self.roadmap_nodes_and_edge_dict[node] = [connect_details for connect_details in
+                                                      self.roadmap_nodes_and_edge_dict[node]
+                                                      if id(connect_details[1]) in spanner_edge_set]
+        # We keep the edges in their original order
+        self.roadmap_edge_list = [edge for edge in self.roadmap_edge_list if id(edge) in spanner_edge_set]
+        # Like during construction, nodes that do not have any connection to an edge are eliminated
+        roadmap_node_list_edged = [node for node in self.roadmap_node_list if self.roadmap_nodes_and_edge_dict[node]]
+        # We obtain the number of nodes removed
+        nodes_removed = len(self.roadmap_node_list) - len(roadmap_node_list_edged)
+        # Iterating through the nodes that are eliminated
+        for node in self.roadmap_node_list:
+            # We remove the node from the node dictionary and the index
+            if not self.roadmap_nodes_and_edge_dict[node]:
+                del self.roadmap_nodes_and_edge_dict[node]
+                self.roadmap_index.remove(node)
+        # We copy the edged nodes into the roadmap node list
+        self.roadmap_node_list = roadmap_node_list_edged
+        # We label the components of the pruned roadmap
+        self.update_roadmap_components()
+        # Cached paths may use removed edges so the cache is emptied
+        self.clear_path_cache()
+        # Returns the number of edges and nodes removed and the observed stretch
+        return edges_removed, nodes_removed, observed_stretch
+
+    # This function obtains the distance between two nodes over the adjacency dictionary if it is within the bound
+    @staticmethod
+    def _bounded_distance(adjacency_dict, source, target, bound):
+        # The cumulative path length to every node reached so far
+        node_cumulative_value = {source: 0}
+        # We initialize the heap with the source node
+        node_heap = [(0, source)]
+        # We iterate until the heap is empty
+        while node_heap:
+            # We pop the closest node from the heap
+            current_value, current_node = heapq.heappop(node_heap)
+            # We check if we have reached the target
+            if current_node == target:
+                return current_value
+            # We skip outdated heap entries
+            if current_value > node_cumulative_value[current_node]:
+                continue
+            # Iterating through the connections of the node
+            for connect_node, connect_length in adjacency_dict[current_node]:
+                # We obtain the cumulative path length till the connected node
+                connect_value = current_value + connect_length
+                # Nodes beyond the bound can't lead to the target within it
+                if connect_value <= bound and connect_value < node_cumulative_value.get(connect_node, float('Inf')):
+                    node_cumulative_value[connect_node] = connect_value
+                    heapq.heappush(node_heap, (connect_value, connect_node))
+        # The target can't be reached within the bound
+        return float('Inf')
+
+    # We use this function to obtain the path from start to goal
+    # map_version identifies the state of a map changed in place (the version of the configuration space is used if any)
+    def find_path(self, map_matrix, dynamic_obstacle_list, start, goal, map_version=0):
+
+        # We measure the time at start
+        start_time = time.time()
+        # We update the edges which are blocked by dynamic obstacles and obtain the map the queries run against
+        map_matrix = self.refresh_blockage(map_matrix, dynamic_obstacle_list)
+        # We search the roadmap for a path
+        prm_path, path_length = self.search_roadmap(map_matrix, start, goal)
+        # In the automatic mode failed queries densify the roadmap along their route over the map before retrying
+        # More nodes can't help if the map itself has no path so only sampling failures are densified
+        if self.configuration_space is not None:
+            map_version = self.configuration_space.version
+        attempt_count = 0
+        if not prm_path and self.auto_densify_attempts > 0 and \
+                self.auto_densify_node_budget > self.auto_densified_node_count and \
+                self.reachable_on_map(map_matrix, start, goal, map_version):
+            # We densify along the route which also confirms that the map has one
+            added_node_list = self.densify_route(map_matrix, start, goal,
+                                                 self.auto_densify_node_budget - self.auto_densified_node_count)
+            self.auto_densified_node_count += len(added_node_list)
+            # We search the roadmap for a path again
+            if added_node_list:
+                prm_path, path_length = self.search_roadmap(map_matrix, start, goal)
+                # Should the route nodes not connect the start and goal the regions around them are densified
+                attempt_count = self.auto_densify_attempts - 1
+        for attempt in range(attempt_count):
+            # We stop once a path has been found
+            if prm_path:
+                break
+            # The densified region doubles in size with every attempt
+            half_size = int(math.ceil(self.node_spacing * 2 ** (attempt + 1)))
+            # Iterating through the start and the goal
+            for coordinate in (start, goal):
+                # We stop densifying once failed queries have added as many nodes as the budget allows
+                node_limit = self.auto_densify_node_budget - self.auto_densified_node_count
+                if node_limit <= 0:
+                    break
+                # We densify the region around the coordinate
+                added_node_list = self.densify([(coordinate[0]-half_size, coordinate[1]-half_size),
+                                                (coordinate[0]+half_size, coordinate[1]+half_size)],
+                                               node_limit=node_limit)
+                self.auto_densified_node_count += len(added_node_list)
+            # We search the roadmap for a path again
+            prm_path, path_length = self.search_roadmap(map_matrix, start, goal)
+        # We measure the time to perform the path planning
+        end_time = time.time()
+        # We return the path details
+        return prm_path, path_length, end_time-start_time, self.roadmap_edge_list
+
+    # This function checks whether the start and goal lie in the same 8-connected region of free cells of the map
+    # The regions are labelled once per map object and map_version so a map changed in place needs a new version
+    def reachable_on_map(self, map_matrix, start, goal, map_version=0):
+        # The start and goal must be free cells inside the map
+        for coordinate in (start, goal):
+            if not (0 <= coordinate[0] < map_matrix.shape[0] and 0 <= coordinate[1] < map_matrix.shape[1] and
+                    map_matrix[coordinate[0], coordinate[1]] > 0):
+                return False
+        # We label the regions again unless they were labelled for this very map object and version
+        if (self.map_label_cache is None or self.map_label_cache[0]() is not map_matrix or
+                self.map_label_cache[1] != map_version):
+            # We import scipy on first use as it is slow to load
+            from scipy import ndimage
+            # We label the 8-connected regions of free cells (every roadmap edge runs through such a region)
+            labels, _ = ndimage.label(np.asarray(map_matrix) > 0, structure=np.ones((3, 3), dtype=bool))
+            # We remember the map without keeping it alive (maps that can't be referenced weakly are never reused)
+            try:
+                self.map_label_cache = (weakref.ref(map_matrix), map_version, labels)
+            except TypeError:
+                self.map_label_cache = None
+                return labels[start[0], start[1]] == labels[goal[0], goal[1]]
+        # We obtain the labels
+        labels = self.map_label_cache[2]
+        # Returns whether the start and goal share a region
+        return labels[start[0], start[1]] == labels[goal[0], goal[1]]
+
+    # This function attaches the start and goal to a path of roadmap nodes unless they are its end nodes already
+    @staticmethod
+    def attach_path_ends(node_path, start, goal):
+        # Returns the path from the start to the goal
+        return (([] if start == node_path[0] else [start]) + node_path +
+                ([] if goal == node_path[-1] else [goal]))
+
+    # This function searches the roadmap for a path from start to goal and returns the path and its length
+    def search_roadmap(self, map_matrix, start, goal):
+
+        # ----------- Attaching the start and goal to nodes in the same component -----------
+
+        # We obtain the closest visible roadmap nodes to the start and the goal in their nearby components
+        start_attachments = self.find_roadmap_attachments(map_matrix, start)
+        goal_attachments = self.find_roadmap_attachments(map_matrix, goal)
+        # The components which both the start and goal can attach to
+        common_components = [component for component in start_attachments if component in goal_attachments]
+        # We can reject the query immediately if the start and goal can't attach to the same component
+        if not common_components:
+            # We failed to find a path so return
+            return [], []
+        # We pick the common component with the shortest combined attachment distance
+        component = min(common_components,
+                        key=lambda label: start_attachments[label][1] + goal_attachments[label][1])
+        # We obtain the point in roadmap to which the start node connects towards and the distance to it
+        start_node_in_roadmap, start_node_distance = start_attachments[component]
+        # We obtain the point in roadmap to which the goal node connects towards and the distance to it
+        goal_node_in_roadmap, goal_node_distance = goal_attachments[component]
+
+        # ----------- Looking up the path cache -----------
+
+        # The cache key identifies the attached roadmap nodes and the roadmap version
+        cache_key = (start_node_in_roadmap, goal_node_in_roadmap, self.roadmap_version)
+        # We check if the path between the attached roadmap nodes is cached
+        if cache_key in self.path_cache:
+            # We mark the path as the most recently used
+            self.path_cache.move_to_end(cache_key)
+            # We obtain the cached path and its length
+            node_path, node_path_length, _ = self.path_cache[cache_key]
+            # We return the path details with the start and goal attached
+            return (self.attach_path_ends(node_path, start, goal),
+                    start_node_distance + node_path_length + goal_node_distance)
+
+        # ----------- Dijkstra's Algorithm -----------
+
+        # We create an open list to indicate the node we want to expand via Dijkstra's algorithm
+        open_list = list(self.roadmap_node_list.copy())
+        # This dictionary marks the location of the coordinate from which we arrived at that point
+        came_from = {}
+        # We create a list which will be used as a min heap
+        node_heap = []
+        # We initalize the heap with the starting node in the roadmap
+        heapq.heappush(node_heap, (start_node_distance, start_node_in_roadmap))
+        # We create an dictionary to hold the current values at every node
+        node_cumulative_value = {}
+        # We iterate through the nodes in the open list
+        for node in self.roadmap_node_list:
+            # We store the default cumulative values as infinite
+            node_cumulative_value[node] = float('Inf')
+        # We mark that the cumulative value of the starting node
+        node_cumulative_value[start_node_in_roadmap] = start_node_distance
+
+        # We mark that the goal has not been reached
+        goal_reached = False
+        # We initialize the path length as zero
+        path_length = 0
+        # We iterate through the while loop until we removed the goal_node_in_roadmap from the open list
+        while True:
+            # We check whether the node heap is empty
+            if not node_heap:
+                # We break the execution
+                break
+            # we pop the current node details from the heap
+            current_node_details = heapq.heappop(node_heap)
+            # We obtain the current node from the above
+            current_node = current_node_details[1]
+            # We check if the node we have popped is the goal:
+            if current_node == goal_node_in_roadmap:
+                # The path length is the cumulative value till the goal node in roadmap plus distance to goal
+                path_length = current_node_details[0] + goal_node_distance
+                # We indicate that the goal has been reached
+                goal_reached = True
+                # We break the execution
+                break
+            # We can't proceed if the current_node is not in the open list
+            if current_node in open_list:
+                # We remove the current node from the open list
+                open_list.remove(current_node)
+                # We obtain the cumulative value till the current node
+                current_node_cumulative_value = current_node_details[0]
+                # We obtain the list of nodes to which the current node is connected to
+                connection_list = self.roadmap_nodes_and_edge_dict[current_node]
+                # We iterate through the elements in the connection list
+                for connect_details in connection_list:
+                    # We obtain the connect node from the connect_details
+                    connect_node = connect_details[0]
+                    # We obtain the edge status
+                    edge_blocked = connect_details[1].dynamic_obstacle_overlap
+                    # we obtain the edge length of the connection
+                    connect_length = connect_details[1].edge_length
+                    # We obtain the cumulative path length till this connect node
+                    connect_node_cumulative_value = current_node_cumulative_value + connect_length
+                    # We check if the coordinate loaded is also in the open list and edge is not blocked
+                    if (connect_node in open_list and not edge_blocked and
+                            connect_node_cumulative_value < node_cumulative_value[connect_node]):
+                        # We update the cumulative value at that point
+                        node_cumulative_value[connect_node] = connect_node_cumulative_value
+                        # We update the came from dictionary as this is the best path so far for the connect node
+                        came_from[connect_node] = current_node
+                        # We also add the connect node to the heap
+                        heapq.heappush(node_heap, (connect_node_cumulative_value, connect_node))
+
+        # We check if we have reached the goal
+        if goal_reached:
+            # We trace the roadmap nodes back from the goal node in roadmap to the start node in roadmap
+            node_path = [goal_node_in_roadmap]
+            while node_path[-1] != start_node_in_roadmap:
+                # We obtain the node the current node came from
+                node_path.append(came_from[node_path[-1]])
+            node_path.reverse()
+            # We check if the path should be cached
+            if self.path_cache_size > 0:
+                # We cache the path between the attached roadmap nodes and its length
+                self.cache_path(cache_key, node_path, path_length - start_node_distance - goal_node_distance)
+            # We return the path details with the start and goal attached
+            return self.attach_path_ends(node_path, start, goal), path_length
+        else:
+            # We failed to find a path so return
+            return [], []
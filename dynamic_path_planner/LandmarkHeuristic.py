@@ -0,0 +1,190 @@
+# LandmarkHeuristic Class holds precomputed landmark distances that give A* a tighter (ALT) heuristic on static maps
+# Created by the Dynamic Path Planner contributors
+# Date: 10/19/2026
+
+# importing the necessary modules
+from .grid_graph import free_space_mask, map_fingerprint, build_grid_graph, grid_distances
+import numpy as np
+import weakref
+import random
+import math
+import os
+
+
+# Obtains the file path at which the landmark tables of a map are persisted (alongside the map)
+def landmark_file_path(map_file_path):
+    # The landmark tables share the name of the map file
+    return os.path.splitext(map_file_path)[0] + '_landmarks.npz'
+
+
+# Class LandmarkHeuristic computes lower bounds on grid distances via the triangle inequality with landmark cells
+class LandmarkHeuristic(object):
+
+    # The class constructor selects landmark_count landmarks in the world map and sweeps their grid distances
+    def __init__(self, world_map, landmark_count=8):
+        # We store the free space of the world map the tables were computed for
+        self.free_mask = free_space_mask(world_map)
+        # We store the fingerprint of the world map to detect when it changes
+        self.map_fingerprint = map_fingerprint(world_map)
+        # We obtain the coordinates of all the free cells
+        free_rows, free_columns = np.nonzero(self.free_mask)
+        # We can't place landmarks in a map without free space
+        if len(free_rows) == 0:
+            raise Exception('Landmarks can\'t be placed in a map without free space')
+        # We build the grid graph once as it is shared by all the sweeps
+        grid_graph = build_grid_graph(self.free_mask)
+        # We start the farthest landmark selection from a random free cell
+        random_index = random.randint(0, len(free_rows) - 1)
+        # This cell only seeds the selection and is not kept as a landmark
+        seed_distances = grid_distances(self.free_mask, [(free_rows[random_index], free_columns[random_index])],
+                                        grid_graph)[0]
+        # The list of landmark coordinates
+        self.landmark_list = []
+        # The distances from each landmark to every cell of the map stored cell by cell so that the landmark
+        # distances of a cell are contiguous (landmark_distances is a view indexed by landmark first)
+        self.cell_landmark_distances = np.empty(self.free_mask.shape + (landmark_count,), dtype=np.float32)
+        self.landmark_distances = self.cell_landmark_distances.transpose(2, 0, 1)
+        # The distance of every cell to its closest landmark so far
+        closest_landmark_distance = seed_distances
+        # Iterating until we have placed all the landmarks
+        for i in range(landmark_count):
+            # Obstacle cells can never be picked as landmarks
+            selection_distance = np.where(self.free_mask, closest_landmark_distance, -1)
+            # We pick the cell farthest from the existing landmarks (unreached components are infinitely far)
+            landmark = np.unravel_index(np.argmax(selection_distance), self.free_mask.shape)
+            # We add the landmark to the list
+            self.landmark_list.append((int(landmark[0]), int(landmark[1])))
+            # We sweep the exact grid distances from the landmark
+            self.landmark_distances[i] = grid_distances(self.free_mask, [landmark], grid_graph)[0]
+            # The seed cell is dropped from the closest landmark distances once the first landmark is placed
+            if i == 0:
+                closest_landmark_distance = self.landmark_distances[0]
+            else:
+                # We update the distance of every cell to its closest landmark
+                closest_landmark_distance = np.minimum(closest_landmark_distance, self.landmark_distances[i])
+        # The float32 rounding error which we subtract from the bounds to keep them admissible
+        self.rounding_slack = self._rounding_slack()
+        # The map object the bounds were last checked against and the result of the check
+        self.checked_map_reference = None
+        self.checked_map_admissible = False
+
+    # Computes the worst case float32 rounding error in the difference of two landmark distances
+    def _rounding_slack(self):
+        # We obtain the finite distances in the tables
+        finite_distances = self.landmark_distances[np.isfinite(self.landmark_distances)]
+        # Returns twice the float32 relative precision of the largest distance
+        return 2 * float(np.finfo(np.float32).eps) * float(finite_distances.max(initial=0))
+
+    # Checks whether the bounds remain admissible on the map (no cell may have been freed since the precomputation)
+    def is_admissible_for(self, map_matrix):
+        # Blocking more cells only increases the true distances so the bounds remain lower bounds
+        return (np.shape(map_matrix) == self.free_mask.shape and
+                not np.any(free_space_mask(map_matrix) & ~self.free_mask))
+
+    # Checks whether the bounds are admissible on the map object, scanning each map object only once
+    # Changing the map in place afterwards is only safe if no cell is freed beyond the precomputed map
+    def is_admissible_for_map_object(self, map_matrix):
+        # We check if this map object was already checked
+        if self.checked_map_reference is not None and self.checked_map_reference() is map_matrix:
+            return self.checked_map_admissible
+        # We scan the map
+        self.checked_map_admissible = self.is_admissible_for(map_matrix)
+        # We remember the map object without keeping it alive
+        try:
+            self.checked_map_reference = weakref.ref(map_matrix)
+        except TypeError:
+            self.checked_map_reference = None
+        # Returns the result of the check
+        return self.checked_map_admissible
+
+    # Obtains the heuristic function to be used by A* for reaching the goal
+    def heuristic_to(self, goal):
+        # The distances from the landmarks to the goal are the same for all the coordinates
+        goal_distances = self.landmark_distances[:, goal[0], goal[1]]
+        # Landmarks that don't reach the goal give no bound so we only keep the indices and distances of those that do
+        goal_landmarks = [(i, distance) for i, distance in enumerate(goal_distances.tolist()) if math.isfinite(distance)]
+        # We bind the tables locally as the heuristic is called for every cell A* reaches
+        cell_landmark_distances = self.cell_landmark_distances
+        rounding_slack = self.rounding_slack
+
+        # The heuristic is the larger of the landmark bound and the euclidean distance
+        def heuristic(coordinate, goal_coordinate):
+            # We obtain the euclidean distance
+            euclidean = math.sqrt((goal_coordinate[0] - coordinate[0]) ** 2 + (goal_coordinate[1] - coordinate[1]) ** 2)
+            # Without landmarks that reach the goal only the euclidean distance remains
+            if not goal_landmarks:
+                return euclidean
+            # We compute the triangle inequality bounds of the cell lazily (cells the goal can't reach are infinite)
+            cell_distances = cell_landmark_distances[coordinate[0], coordinate[1]].tolist()
+            bound = max(abs(cell_distances[i] - distance) for i, distance in goal_landmarks) - rounding_slack
+            # Returns the tighter of the landmark bound and the euclidean distance
+            return max(bound, euclidean)
+        # Returns the heuristic function
+        return heuristic
+
+    # Obtains the landmark tables and the information needed to validate them as a dictionary of arrays
+    def to_arrays(self):
+        # Returns the float32 tables, the landmarks and the free space of the map they were computed for
+        return {'landmark_distances': self.landmark_distances,
+                'landmark_list': np.array(self.landmark_list, dtype=np.int64).reshape(-1, 2),
+                'free_mask': np.packbits(self.free_mask), 'map_shape': np.array(self.free_mask.shape, dtype=np.int64),
+                'map_fingerprint': self.map_fingerprint}
+
+    # Rebuilds the landmark heuristic from the dictionary of arrays obtained via to_arrays
+    @staticmethod
+    def from_arrays(tables):
+        # We create the object without running the precomputation
+        landmark_heuristic = LandmarkHeuristic.__new__(LandmarkHeuristic)
+        # We restore the landmark tables cell by cell
+        landmark_heuristic.cell_landmark_distances = np.ascontiguousarray(
+            np.asarray(tables['landmark_distances'], dtype=np.float32).transpose(1, 2, 0))
+        landmark_heuristic.landmark_distances = landmark_heuristic.cell_landmark_distances.transpose(2, 0, 1)
+        landmark_heuristic.landmark_list = [tuple(landmark) for landmark in
+                                            np.asarray(tables['landmark_list']).reshape(-1, 2).tolist()]
+        # We restore the free space of the map the tables were computed for
+        map_shape = tuple(int(value) for value in tables['map_shape'])
+        landmark_heuristic.free_mask = np.unpackbits(tables['free_mask'], count=map_shape[0] * map_shape[1]
+                                                     ).reshape(map_shape).astype(bool)
+        landmark_heuristic.map_fingerprint = str(tables['map_fingerprint'])
+        # We recompute the rounding slack from the restored tables
+        landmark_heuristic.rounding_slack = landmark_heuristic._rounding_slack()
+        # The restored tables haven't been checked against any map object yet
+        landmark_heuristic.checked_map_reference = None
+        landmark_heuristic.checked_map_admissible = False
+        # Returns the landmark heuristic
+        return landmark_heuristic
+
+    # Persists the landmark tables into the file path specified
+    def save(self, file_path):
+        # We save the float32 tables along with the information needed to validate them
+        with open(file_path, 'wb') as file:
+            np.savez(file, **self.to_arrays())
+
+    # Loads persisted landmark tables and returns None if they were computed for a different map
+    @staticmethod
+    def load(file_path, world_map):
+        # We load the persisted arrays
+        with np.load(file_path) as tables:
+            # We check if the tables were computed for this map
+            if str(tables['map_fingerprint']) != map_fingerprint(world_map):
+                return None
+            # Returns the landmark heuristic
+            return LandmarkHeuristic.from_arrays(tables)
+
+    # Loads the landmark tables persisted alongside the map file or rebuilds them if the map has changed
+    @staticmethod
+    def load_or_build(world_map, map_file_path, landmark_count=8):
+        # The landmark tables are stored next to the map file
+        file_path = landmark_file_path(map_file_path)
+        # We try to load the persisted tables
+        if os.path.exists(file_path):
+            landmark_heuristic = LandmarkHeuristic.load(file_path, world_map)
+            # We use the persisted tables if they are valid for this map and have enough landmarks
+            if landmark_heuristic is not None and len(landmark_heuristic.landmark_list) >= landmark_count:
+                return landmark_heuristic
+        # We perform the precomputation as the persisted tables are missing or stale
+        landmark_heuristic = LandmarkHeuristic(world_map, landmark_count)
+        # We persist the tables so that later runs can reuse them
+        landmark_heuristic.save(file_path)
+        # Returns the landmark heuristic
+        return landmark_heuristic
@@ -0,0 +1,97 @@
+# NodeGridIndex Class holds roadmap nodes in a grid of buckets so that nodes can be added and searched incrementally
+# Created by the Dynamic Path Planner contributors
+# Date: 10/19/2026
+
+# importing the necessary modules
+import heapq
+import math
+
+
+# Class NodeGridIndex is a spatial hash of (y, x) nodes that supports insertion, removal and nearest node queries
+class NodeGridIndex(object):
+
+    # The class constructor takes in the side length of the buckets and an optional list of nodes to index
+    def __init__(self, cell_size, node_list=()):
+        # We store the side length of the square buckets
+        self.cell_size = cell_size
+        # The dictionary mapping bucket coordinates to the nodes inside them
+        self.cell_dict = {}
+        # The number of nodes in the index
+        self.node_count = 0
+        # Iterating through the nodes provided
+        for node in node_list:
+            # We add the node to the index
+            self.add(node)
+
+    # This function obtains the bucket in which a coordinate lies
+    def _cell_of(self, coordinate):
+        # Returns the bucket row and column
+        return int(math.floor(coordinate[0] / self.cell_size)), int(math.floor(coordinate[1] / self.cell_size))
+
+    # This function adds a node to the index
+    def add(self, node):
+        # We append the node to its bucket
+        self.cell_dict.setdefault(self._cell_of(node), []).append(node)
+        # We increment the node count by one
+        self.node_count += 1
+
+    # This function removes a node from the index
+    def remove(self, node):
+        # We obtain the bucket of the node
+        cell = self._cell_of(node)
+        # We remove the node from its bucket
+        self.cell_dict[cell].remove(node)
+        # We drop the bucket once it is empty
+        if not self.cell_dict[cell]:
+            del self.cell_dict[cell]
+        # We decrement the node count by one
+        self.node_count -= 1
+
+    # This generator yields (distance, node) pairs in order of increasing distance to the coordinate
+    def nearest_nodes(self, coordinate):
+        # We obtain the bucket in which the coordinate lies
+        cell_row, cell_column = self._cell_of(coordinate)
+        # The heap of nodes found in the buckets visited so far
+        node_heap = []
+        # The number of nodes found so far
+        nodes_found = 0
+        # The ring of buckets around the coordinate bucket that we are visiting
+        ring = 0
+        # We keep visiting rings of buckets until every node has been found
+        while nodes_found < self.node_count:
+            # The buckets along the top and bottom of the ring
+            ring_cells = [(cell_row + dy, cell_column + dx) for dy in {-ring, ring} for dx in range(-ring, ring + 1)]
+            # The buckets along the left and right of the ring
+            ring_cells += [(cell_row + dy, cell_column + dx) for dx in {-ring, ring} for dy in range(1 - ring, ring)]
+            # Iterating through the buckets in the ring
+            for cell in ring_cells:
+                # Iterating through the nodes in the bucket
+                for node in self.cell_dict.get(cell, ()):
+                    # We push the node and its distance to the coordinate onto the heap
+                    heapq.heappush(node_heap, (math.sqrt((node[0] - coordinate[0]) ** 2 +
+                                                         (node[1] - coordinate[1]) ** 2), node))
+                    nodes_found += 1
+            # Nodes outside the visited rings are at least this far from the coordinate
+            search_radius = ring * self.cell_size
+            # We yield the nodes that are certain to be closer than any node not yet found
+            while node_heap and node_heap[0][0] <= search_radius:
+                yield heapq.heappop(node_heap)
+            # We move on to the next ring
+            ring += 1
+        # Every node has been found so the remaining nodes are yielded in order
+        while node_heap:
+            yield heapq.heappop(node_heap)
+
+    # This function obtains up to k nearest (distance, node) pairs within the maximum distance of the coordinate
+    def k_nearest(self, coordinate, k, max_distance=float('Inf')):
+        # The list of nearest nodes
+        nearest_list = []
+        # Iterating through the nodes in order of increasing distance
+        for distance, node in self.nearest_nodes(coordinate):
+            # We stop once we have enough nodes or the nodes are too far away
+            if len(nearest_list) >= k or distance > max_distance:
+                break
+            # We add the node to the list
+            nearest_list.append((distance, node))
+        # Returns the nearest nodes
+        return nearest_list
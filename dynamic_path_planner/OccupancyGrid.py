@@ -0,0 +1,271 @@
+# OccupancyGrid Class holds a world map compactly as uint8 cells, bit-packed cells or memory-mapped tiles on disk
+# Created by the Dynamic Path Planner contributors
+# Date: 10/19/2026
+
+# importing the necessary modules
+import numpy as np
+import struct
+import math
+
+# The header of a tiled occupancy grid file holds a magic string, the tile size, the rows and the columns
+tiled_file_header = struct.Struct('<4sIII')
+# The magic string that identifies tiled occupancy grid files
+tiled_file_magic = b'OCCG'
+
+
+# Obtains the number of free cells (non zero entries) of a map held either as an array or an occupancy grid
+def count_free_cells(map_matrix):
+    # Occupancy grids count their free cells without expanding the whole map
+    if isinstance(map_matrix, OccupancyGrid):
+        return map_matrix.count_free()
+    # Returns the number of non zero entries of the array
+    return int(np.count_nonzero(map_matrix))
+
+
+# Class OccupancyGrid supports map_matrix[y, x] reads and writes (obstacles are zeros) so planners can index it directly
+class OccupancyGrid(object):
+
+    # storage can be 'uint8', 'bits' or 'tiled' (memory-mapped tiles in the file specified)
+    def __init__(self, shape, storage='uint8', file_path=None, tile_size=256):
+        # We store the number of rows and columns
+        self.shape = (int(shape[0]), int(shape[1]))
+        # We store the storage format
+        self.storage = storage
+        # We check the storage format
+        if storage == 'uint8':
+            # One byte per cell
+            self.cells = np.zeros(self.shape, dtype=np.uint8)
+        elif storage == 'bits':
+            # One bit per cell with every row padded to whole bytes
+            self.cells = np.zeros((self.shape[0], int(math.ceil(self.shape[1] / 8))), dtype=np.uint8)
+        elif storage == 'tiled':
+            # Tiled grids live in a file as the map may not fit in memory
+            if file_path is None:
+                raise Exception('A file path is needed for tiled occupancy grids')
+            # We store the side length of the square tiles
+            self.tile_size = tile_size
+            # We write the header of the file
+            with open(file_path, 'wb') as file:
+                file.write(tiled_file_header.pack(tiled_file_magic, tile_size, self.shape[0], self.shape[1]))
+            # The tiles are stored one after another so that every tile is contiguous in the file
+            self.cells = np.memmap(file_path, dtype=np.uint8, mode='r+', offset=tiled_file_header.size,
+                                   shape=self._tile_grid_shape())
+        else:
+            raise Exception('Unknown occupancy grid storage: ' + repr(storage))
+
+    # Obtains the shape of the memory-mapped tile array (tile rows, tile columns, tile size, tile size)
+    def _tile_grid_shape(self):
+        # Returns the number of tiles along both axes followed by the tile dimensions
+        return (int(math.ceil(self.shape[0] / self.tile_size)), int(math.ceil(self.shape[1] / self.tile_size)),
+                self.tile_size, self.tile_size)
+
+    # Creates an occupancy grid from an array in which non zero entries are free space
+    @staticmethod
+    def from_array(map_matrix, storage='uint8', file_path=None, tile_size=256):
+        # We create an empty occupancy grid
+        occupancy_grid = OccupancyGrid(np.shape(map_matrix), storage, file_path, tile_size)
+        # We copy the free space over in strips of rows to limit the memory used for conversion
+        strip_rows = tile_size if storage == 'tiled' else occupancy_grid.shape[0]
+        # Iterating through the strips
+        for row in range(0, occupancy_grid.shape[0], strip_rows):
+            # We write the strip into the grid
+            occupancy_grid.write_region(row, 0, np.asarray(map_matrix[row:row + strip_rows, :]) > 0)
+        # Returns the occupancy grid
+        return occupancy_grid
+
+    # Creates an occupancy grid from a bitmap image in which non zero pixels are free space
+    @staticmethod
+    def from_image(image_path, storage='uint8', file_path=None, tile_size=256):
+        # We import PIL on first use as it is slow to load
+        from PIL import Image
+        # Reads in the bitmap world image
+        image = Image.open(image_path)
+        # We create an empty occupancy grid
+        occupancy_grid = OccupancyGrid((image.size[1], image.size[0]), storage, file_path, tile_size)
+        # We copy the image over in strips of rows to limit the memory used for conversion
+        strip_rows = tile_size if storage == 'tiled' else occupancy_grid.shape[0]
+        # Iterating through the strips
+        for row in range(0, occupancy_grid.shape[0], strip_rows):
+            # We obtain the strip of the image
+            strip = image.crop((0, row, image.size[0], min(row + strip_rows, image.size[1])))
+            # We write the strip into the grid
+            occupancy_grid.write_region(row, 0, np.array(strip) != 0)
+        # Returns the occupancy grid
+        return occupancy_grid
+
+    # Opens a tiled occupancy grid file written earlier
+    @staticmethod
+    def open(file_path, mode='r+'):
+        # We read the header of the file
+        with open(file_path, 'rb') as file:
+            magic, tile_size, rows, columns = tiled_file_header.unpack(file.read(tiled_file_header.size))
+        # We check that the file holds an occupancy grid
+        if magic != tiled_file_magic:
+            raise Exception('The file is not a tiled occupancy grid: ' + repr(file_path))
+        # We create the object without allocating any cells
+        occupancy_grid = OccupancyGrid.__new__(OccupancyGrid)
+        occupancy_grid.shape = (rows, columns)
+        occupancy_grid.storage = 'tiled'
+        occupancy_grid.tile_size = tile_size
+        # The tiles are only loaded from the file as they are accessed
+        occupancy_grid.cells = np.memmap(file_path, dtype=np.uint8, mode=mode, offset=tiled_file_header.size,
+                                         shape=occupancy_grid._tile_grid_shape())
+        # Returns the occupancy grid
+        return occupancy_grid
+
+    # Reads a cell via map_matrix[y, x] or a region via map_matrix[y1:y2, x1:x2] (regions are returned as arrays)
+    def __getitem__(self, key):
+        # We obtain the row and column of the key
+        row, column = key
+        # We check if a region has been requested
+        if isinstance(row, slice) or isinstance(column, slice):
+            return self._read_slices(row, column)
+        # We check the storage format
+        if self.storage == 'uint8':
+            return self.cells[row, column]
+        elif self.storage == 'bits':
+            return (self.cells[row, column >> 3] >> (7 - (column & 7))) & 1
+        # We obtain the cell from its tile
+        return self.cells[row // self.tile_size, column // self.tile_size, row % self.tile_size,
+                          column % self.tile_size]
+
+    # Writes a cell via map_matrix[y, x] = value where zero values are obstacles and anything else is free
+    def __setitem__(self, key, value):
+        # We obtain the row and column of the key
+        row, column = key
+        # We check if a region is being written
+        if isinstance(row, slice) or isinstance(column, slice):
+            # We obtain the bounds of the region
+            row_start, row_stop, _ = (row if isinstance(row, slice) else slice(row, row + 1)).indices(self.shape[0])
+            column_start, column_stop, _ = (column if isinstance(column, slice) else
+                                            slice(column, column + 1)).indices(self.shape[1])
+            # We write the region with the value broadcast across it
+            self.write_region(row_start, column_start, np.broadcast_to(np.asarray(value) > 0, (
+                row_stop - row_start, column_stop - column_start)))
+            return
+        # The value is stored as a one for free space and a zero for obstacles
+        free = 1 if value > 0 else 0
+        # We check the storage format
+        if self.storage == 'uint8':
+            self.cells[row, column] = free
+        elif self.storage == 'bits':
+            # The mask of the bit that holds the cell
+            bit_mask = 1 << (7 - (column & 7))
+            # We set or clear the bit
+            if free:
+                self.cells[row, column >> 3] |= bit_mask
+            else:
+                self.cells[row, column >> 3] &= ~bit_mask & 0xFF
+        else:
+            # We write the cell into its tile
+            self.cells[row // self.tile_size, column // self.tile_size, row % self.tile_size,
+                       column % self.tile_size] = free
+
+    # Numpy functions see the occupancy grid as a uint8 array of ones (free) and zeros (obstacles)
+    def __array__(self, dtype=None, copy=None):
+        # We read the whole map
+        array = self.to_array()
+        # Returns the array in the type requested
+        return array if dtype is None else array.astype(dtype)
+
+    # Reads the region between the slices as a uint8 array
+    def _read_slices(self, row, column):
+        # We obtain the bounds of the region
+        row_start, row_stop, row_step = (row if isinstance(row, slice) else slice(row, row + 1)).indices(self.shape[0])
+        column_start, column_stop, column_step = (column if isinstance(column, slice) else
+                                                  slice(column, column + 1)).indices(self.shape[1])
+        # We read the region covered by the slices
+        region = self.read_region(row_start, column_start, max(row_stop - row_start, 0),
+                                  max(column_stop - column_start, 0))
+        # We apply the steps of the slices
+        region = region[::row_step, ::column_step]
+        # Integer keys drop their axis like numpy indexing does
+        if not isinstance(row, slice):
+            region = region[0]
+        elif not isinstance(column, slice):
+            region = region[:, 0]
+        # Returns the region
+        return region
+
+    # Reads the region of the specified height and width from the top left cell as a uint8 array
+    def read_region(self, row, column, height, width):
+        # We check the storage format
+        if self.storage == 'uint8':
+            return self.cells[row:row + height, column:column + width].copy()
+        elif self.storage == 'bits':
+            # We unpack the bytes that cover the columns of the region
+            unpacked = np.unpackbits(self.cells[row:row + height, column >> 3:(column + width + 7) >> 3], axis=1)
+            # We drop the bits outside the region
+            return unpacked[:, column & 7:(column & 7) + width]
+        # The array into which the tiles are copied
+        region = np.zeros((height, width), dtype=np.uint8)
+        # Iterating through the tiles that overlap the region
+        for tile_row in range(row // self.tile_size, (row + height - 1) // self.tile_size + 1 if height else 0):
+            for tile_column in range(column // self.tile_size,
+                                     (column + width - 1) // self.tile_size + 1 if width else 0):
+                # We obtain the overlap of the tile and the region in map coordinates
+                y1 = max(row, tile_row * self.tile_size)
+                y2 = min(row + height, (tile_row + 1) * self.tile_size)
+                x1 = max(column, tile_column * self.tile_size)
+                x2 = min(column + width, (tile_column + 1) * self.tile_size)
+                # We copy the overlap out of the tile
+                region[y1 - row:y2 - row, x1 - column:x2 - column] = self.cells[
+                    tile_row, tile_column, y1 - tile_row * self.tile_size:y2 - tile_row * self.tile_size,
+                    x1 - tile_column * self.tile_size:x2 - tile_column * self.tile_size]
+        # Returns the region
+        return region
+
+    # Writes the boolean free space array into the grid with its top left cell at the row and column specified
+    def write_region(self, row, column, free_mask):
+        # We obtain the height and width of the region
+        height, width = free_mask.shape
+        # We check the storage format
+        if self.storage == 'uint8':
+            self.cells[row:row + height, column:column + width] = free_mask
+        elif self.storage == 'bits':
+            # We read the whole bytes covering the region so that bits outside it are preserved
+            region = self.read_region(row, (column >> 3) << 3, height, ((column + width + 7) >> 3 << 3) -
+                                      (column >> 3 << 3))
+            # We overwrite the bits of the region
+            region[:, column & 7:(column & 7) + width] = free_mask
+            # We pack the bits back into the grid
+            self.cells[row:row + height, column >> 3:(column + width + 7) >> 3] = np.packbits(region, axis=1)
+        else:
+            # Iterating through the tiles that overlap the region
+            for tile_row in range(row // self.tile_size, (row + height - 1) // self.tile_size + 1 if height else 0):
+                for tile_column in range(column // self.tile_size,
+                                         (column + width - 1) // self.tile_size + 1 if width else 0):
+                    # We obtain the overlap of the tile and the region in map coordinates
+                    y1 = max(row, tile_row * self.tile_size)
+                    y2 = min(row + height, (tile_row + 1) * self.tile_size)
+                    x1 = max(column, tile_column * self.tile_size)
+                    x2 = min(column + width, (tile_column + 1) * self.tile_size)
+                    # We copy the overlap into the tile
+                    self.cells[tile_row, tile_column, y1 - tile_row * self.tile_size:y2 - tile_row * self.tile_size,
+                               x1 - tile_column * self.tile_size:x2 - tile_column * self.tile_size] = free_mask[
+                        y1 - row:y2 - row, x1 - column:x2 - column]
+
+    # Obtains the whole map as a uint8 array of ones (free) and zeros (obstacles)
+    def to_array(self):
+        # Returns the region covering the whole map
+        return self.read_region(0, 0, self.shape[0], self.shape[1])
+
+    # Obtains the number of free cells in the map
+    def count_free(self):
+        # The padding bits and cells of partial tiles are always zero so we can count the raw storage
+        if self.storage == 'bits':
+            # The number of set bits in every possible byte
+            bit_counts = np.unpackbits(np.arange(256, dtype=np.uint8)[:, np.newaxis], axis=1).sum(axis=1)
+            # We count the set bits a strip of rows at a time to limit memory use
+            return int(sum(bit_counts[self.cells[row:row + 1024]].sum() for row in range(0, self.shape[0], 1024)))
+        elif self.storage == 'tiled':
+            # We count the free cells one row of tiles at a time to limit memory use
+            return int(sum(np.count_nonzero(self.cells[tile_row]) for tile_row in range(self.cells.shape[0])))
+        # Returns the number of non zero cells
+        return int(np.count_nonzero(self.cells))
+
+    # Writes any pending changes of a tiled grid to its file
+    def flush(self):
+        # Only memory-mapped grids need to be flushed
+        if self.storage == 'tiled':
+            self.cells.flush()
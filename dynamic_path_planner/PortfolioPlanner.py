@@ -0,0 +1,268 @@
+# PortfolioPlanner Class races several path planners in parallel processes and returns the first acceptable path
+# Created by the Dynamic Path Planner contributors
+# Date: 10/19/2026
+
+# importing the necessary modules
+from multiprocessing.connection import wait
+from .ConfigurationSpace import ConfigurationSpace, planning_map
+from .grid_graph import path_with_ends, a_star_path
+import multiprocessing
+import random
+import time
+import math
+
+# The planners that can take part in the portfolio
+portfolio_planner_names = ['a_star', 'rrt', 'prm']
+
+
+# Runs a single planner for a query and returns its path from start to goal and the path length
+def _run_planner(planner_name, planner_settings, map_matrix, dynamic_obstacle_list, start, goal):
+    # We check which planner should run
+    if planner_name == 'prm':
+        # We run the integrated PRM algorithm on the roadmap resident in this worker
+        path, path_length = planner_settings['integrated_prm'].find_path(map_matrix, dynamic_obstacle_list,
+                                                                         start, goal)[:2]
+        # Returns the path which already runs from start to goal
+        return (path_with_ends(path, start, goal) if path else []), path_length
+    # With a robot footprint the dynamic obstacles are stamped into the configuration space of the static map
+    map_matrix = planning_map(map_matrix, None, planner_settings['configuration_space'], dynamic_obstacle_list)
+    if planner_name == 'a_star':
+        # We import the planner on first use
+        from . import a_star
+        # We run the A* algorithm
+        path, path_length = a_star.find_path(map_matrix, start, goal, planner_settings['landmark_heuristic'])[:2]
+        # A* finds a path whenever its length is finite even if the goal is next to the start and the path is empty
+        return (a_star_path(map_matrix, path, start, goal) if path_length != float('Inf') else []), path_length
+    # We import the planner on first use
+    from . import rrt
+    # We run the RRT algorithm
+    path, path_length = rrt.find_path(map_matrix, start, goal, planner_settings['rrt_growth_limit'],
+                                      planner_settings['rrt_goal_distance'])[:2]
+    # RRT returns the path from the goal back to the node after the start
+    return (path_with_ends(path[::-1], start, goal) if path else []), path_length
+
+
+# Serves the races of a planner in a persistent worker process until it is told to stop
+def _planner_worker(connection, planner_name, planner_settings):
+    # We serve races until the portfolio closes the connection or sends None
+    while True:
+        try:
+            message = connection.recv()
+        except EOFError:
+            break
+        if message is None:
+            break
+        # We obtain the query of the race
+        race_id, map_matrix, dynamic_obstacle_list, start, goal, seed = message
+        # We seed the random number generator as forked workers would otherwise repeat the parent's random numbers
+        random.seed(seed)
+        try:
+            # We run the planner
+            path, path_length = _run_planner(planner_name, planner_settings, map_matrix, dynamic_obstacle_list,
+                                             tuple(start), tuple(goal))
+        except Exception as exception:
+            # A failing planner simply doesn't find a path
+            path, path_length = [], repr(exception)
+        # We send the path details along with the race they belong to
+        connection.send((race_id, path, path_length))
+    # We close our end of the connection
+    connection.close()
+
+
+# Class PortfolioPlanner launches the planners concurrently against the same map and obstacle state
+# Every planner runs in a persistent worker so the roadmap stays resident with its blockage state and path cache
+class PortfolioPlanner(object):
+
+    # The class constructor takes in the world map and the planners of the portfolio
+    # quality_threshold is the largest ratio of path length to straight line distance at which a path is accepted
+    # deadline is the number of seconds after which the best path so far is returned (None waits for every planner)
+    def __init__(self, world_map, planner_list=('a_star', 'rrt', 'prm'), quality_threshold=1.5, deadline=None,
+                 prm_arguments=None, rrt_growth_limit=10, rrt_goal_distance=10, landmark_heuristic=None,
+                 robot_footprint=None):
+        # We check that every planner is known
+        for planner_name in planner_list:
+            if planner_name not in portfolio_planner_names:
+                raise Exception('Unknown portfolio planner: ' + repr(planner_name))
+        # We store the world map and the settings of the portfolio
+        self.world_map = world_map
+        self.planner_list = list(planner_list)
+        self.quality_threshold = quality_threshold
+        self.deadline = deadline
+        # We store the settings of the planners
+        self.rrt_growth_limit = rrt_growth_limit
+        self.rrt_goal_distance = rrt_goal_distance
+        self.landmark_heuristic = landmark_heuristic
+        self.robot_footprint = robot_footprint
+        # The roadmap is built once up front and handed to the worker in which it stays resident
+        self.integrated_prm = None
+        if 'prm' in self.planner_list:
+            # We import the planner on first use
+            from .IntegratedPRM import IntegratedPRM
+            # We build the roadmap
+            self.integrated_prm = IntegratedPRM(world_map, robot_footprint=robot_footprint,
+                                                **(prm_arguments if prm_arguments is not None else {}))
+        # The configuration space of the static map which the A* and RRT workers stamp dynamic obstacles into
+        self.configuration_space = None
+        if robot_footprint is not None:
+            self.configuration_space = (self.integrated_prm.configuration_space if self.integrated_prm is not None
+                                        else ConfigurationSpace(world_map, robot_footprint))
+        # Forked workers inherit the roadmap and configuration space without copying while other platforms pickle them
+        start_methods = multiprocessing.get_all_start_methods()
+        self.process_context = multiprocessing.get_context('fork' if 'fork' in start_methods else None)
+        # The worker process and connection of every planner that has a worker
+        self.worker_dict = {}
+        # The race that a planner's worker is still running after it lost (only the roadmap worker is kept running)
+        self.pending_race_dict = {}
+        # The number of races run so far
+        self.race_count = 0
+        # The statistics of every planner which can be used to tune the portfolio
+        self.win_statistics = {planner_name: {'races': 0, 'wins': 0, 'acceptable': 0, 'failures': 0, 'cancelled': 0,
+                                              'skipped': 0, 'finish_time': 0.0} for planner_name in self.planner_list}
+
+    # This function obtains the settings a planner's worker needs
+    def _planner_settings(self, planner_name):
+        # The roadmap worker only needs the roadmap
+        if planner_name == 'prm':
+            return {'integrated_prm': self.integrated_prm}
+        # Returns the settings of the grid planners
+        return {'configuration_space': self.configuration_space, 'landmark_heuristic': self.landmark_heuristic,
+                'rrt_growth_limit': self.rrt_growth_limit, 'rrt_goal_distance': self.rrt_goal_distance}
+
+    # This function starts the worker of a planner
+    def _start_worker(self, planner_name):
+        # We create the connection through which the worker receives queries and reports
+        connection, worker_connection = self.process_context.Pipe(duplex=True)
+        # We launch the worker
+        process = self.process_context.Process(target=_planner_worker, daemon=True,
+                                               args=(worker_connection, planner_name,
+                                                     self._planner_settings(planner_name)))
+        process.start()
+        # The parent doesn't use the worker's end of the connection
+        worker_connection.close()
+        self.worker_dict[planner_name] = (process, connection)
+
+    # This function stops the worker of a planner
+    def _stop_worker(self, planner_name):
+        # We terminate the worker and release its connection
+        process, connection = self.worker_dict.pop(planner_name)
+        process.terminate()
+        process.join()
+        connection.close()
+        # The worker no longer runs any race
+        self.pending_race_dict.pop(planner_name, None)
+
+    # This function receives a report from a planner's worker and returns None if the worker died
+    def _receive(self, planner_name):
+        try:
+            # Returns the race, path and path length
+            return self.worker_dict[planner_name][1].recv()
+        except (EOFError, OSError):
+            # The worker died without reporting so it is started again for the next race
+            self._stop_worker(planner_name)
+            return None
+
+    # This function obtains the quality of a path as the ratio of its length to the straight line distance
+    @staticmethod
+    def path_quality(path_length, start, goal):
+        # We obtain the straight line distance which no path can be shorter than
+        straight_line_distance = math.sqrt((goal[0] - start[0]) ** 2 + (goal[1] - start[1]) ** 2)
+        # A path between coinciding start and goal can't be improved
+        if straight_line_distance == 0:
+            return 1.0
+        # Returns the ratio
+        return path_length / straight_line_distance
+
+    # We use this function to race the planners for a path from start to goal over the map with dynamic obstacles
+    # Every path is returned from start to goal whichever planner found it
+    def find_path(self, map_matrix, dynamic_obstacle_list, start, goal):
+        # We measure the time at start
+        start_time = time.time()
+        # We number the race
+        self.race_count += 1
+        race_id = self.race_count
+        # The connections of the planners taking part in the race
+        connection_dict = {}
+        # Iterating through the planners
+        for planner_name in self.planner_list:
+            # We collect the result of an earlier race that the worker may have finished since and discard it
+            if planner_name in self.pending_race_dict and self.worker_dict[planner_name][1].poll():
+                if self._receive(planner_name) is not None:
+                    del self.pending_race_dict[planner_name]
+            # A worker still busy with an earlier race sits this race out
+            if planner_name in self.pending_race_dict:
+                self.win_statistics[planner_name]['skipped'] += 1
+                continue
+            # We start the worker if it isn't running
+            if planner_name not in self.worker_dict or not self.worker_dict[planner_name][0].is_alive():
+                if planner_name in self.worker_dict:
+                    self._stop_worker(planner_name)
+                self._start_worker(planner_name)
+            # We send the query to the worker
+            connection = self.worker_dict[planner_name][1]
+            connection.send((race_id, map_matrix, dynamic_obstacle_list, start, goal, random.getrandbits(32)))
+            connection_dict[connection] = planner_name
+            self.win_statistics[planner_name]['races'] += 1
+        # The best path found so far, its length, quality and planner
+        best_path, best_length, best_quality, winner = [], float('Inf'), float('Inf'), None
+        # We wait for the planners until one finds an acceptable path, every planner finishes or the deadline passes
+        while connection_dict:
+            # We obtain the time left until the deadline
+            timeout = None if self.deadline is None else self.deadline - (time.time() - start_time)
+            if timeout is not None and timeout <= 0:
+                break
+            # We wait for planners to report
+            ready_connections = wait(list(connection_dict), timeout)
+            # Iterating through the planners that reported
+            for connection in ready_connections:
+                # We obtain the planner of the connection
+                planner_name = connection_dict.pop(connection)
+                # We receive the path details
+                report = self._receive(planner_name)
+                path, path_length = ([], None) if report is None else report[1:]
+                # We record when the planner finished
+                self.win_statistics[planner_name]['finish_time'] += time.time() - start_time
+                # We check if the planner failed to find a path
+                if not path:
+                    self.win_statistics[planner_name]['failures'] += 1
+                    continue
+                # We obtain the quality of the path
+                quality = self.path_quality(path_length, start, goal)
+                # We check if the path is acceptable
+                if quality <= self.quality_threshold:
+                    self.win_statistics[planner_name]['acceptable'] += 1
+                # We check if this is the best path so far
+                if quality < best_quality:
+                    best_path, best_length, best_quality, winner = path, path_length, quality, planner_name
+            # We stop as soon as an acceptable path has been found
+            if best_quality <= self.quality_threshold:
+                break
+        # We cancel the planners that are still running
+        for planner_name in connection_dict.values():
+            self.win_statistics[planner_name]['cancelled'] += 1
+            # The roadmap worker keeps running so that its roadmap survives and its result is discarded later
+            if planner_name == 'prm':
+                self.pending_race_dict[planner_name] = race_id
+            else:
+                # The grid planners keep no state between races so they are stopped and started again when needed
+                self._stop_worker(planner_name)
+        # We record the win
+        if winner is not None:
+            self.win_statistics[winner]['wins'] += 1
+        # We measure the time to perform the path planning
+        end_time = time.time()
+        # Returns the best path, its length, the computation time and the planner that found it
+        return best_path, best_length if best_path else [], end_time-start_time, winner
+
+    # This function stops the workers of the portfolio
+    def close(self):
+        # Iterating through the workers
+        for planner_name in list(self.worker_dict):
+            process, connection = self.worker_dict[planner_name]
+            # Idle workers exit once told to
+            try:
+                connection.send(None)
+            except OSError:
+                pass
+            process.join(timeout=1)
+            # Workers that are still busy are stopped
+            self._stop_worker(planner_name)
@@ -3,7 +3,7 @@
 # Date: 3/9/2019
 
 # We import the necessary modules
-from rrt import check_hit, euclidean_distance
+from .rrt import check_hit, euclidean_distance
 
 
 # Class Integrated_PRM contains the functionality needed to implement the Integrated PRM path planning algorithm
@@ -25,16 +25,21 @@ class RoadmapEdge(object):
         self.dynamic_obstacle_overlap = False
 
     # This function computes whether the edge overlaps a dynamic obstacle or not
-    def update_edge_blockage(self, dynamic_obstacle_list, world_map):
+    # margin is the distance by which obstacles are inflated in the world map (the robot footprint radius)
+    def update_edge_blockage(self, dynamic_obstacle_list, world_map, margin=0):
         # We start by marking that there is no overlap
         self.dynamic_obstacle_overlap = False
         # We iterate through the dynamic obstacles in the obstacle list
         for dynamic_obstacle in dynamic_obstacle_list:
             # The following conditions are to check if there is a possibility of the edge overlapping the obstacle
-            if not ((self.vertex_1[0] < dynamic_obstacle.min_y and self.vertex_2[0] < dynamic_obstacle.min_y) or
-                    (self.vertex_1[0] > dynamic_obstacle.max_y and self.vertex_2[0] > dynamic_obstacle.max_y) or
-                    (self.vertex_1[1] < dynamic_obstacle.min_x and self.vertex_2[1] < dynamic_obstacle.min_x) or
-                    (self.vertex_1[1] > dynamic_obstacle.max_x and self.vertex_2[1] > dynamic_obstacle.max_x)):
+            if not ((self.vertex_1[0] < dynamic_obstacle.min_y - margin and
+                     self.vertex_2[0] < dynamic_obstacle.min_y - margin) or
+                    (self.vertex_1[0] > dynamic_obstacle.max_y + margin and
+                     self.vertex_2[0] > dynamic_obstacle.max_y + margin) or
+                    (self.vertex_1[1] < dynamic_obstacle.min_x - margin and
+                     self.vertex_2[1] < dynamic_obstacle.min_x - margin) or
+                    (self.vertex_1[1] > dynamic_obstacle.max_x + margin and
+                     self.vertex_2[1] > dynamic_obstacle.max_x + margin)):
                 # We check for any collisions with the dynamic obstacle
                 if check_hit(world_map, self.vertex_1, self.vertex_2):
                     # We mark that there has been an overlap
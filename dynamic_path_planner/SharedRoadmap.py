@@ -0,0 +1,414 @@
+# SharedRoadmap Class publishes an integrated PRM roadmap and its map into shared memory for query worker processes
+# Created by the Dynamic Path Planner contributors
+# Date: 10/19/2026
+
+# importing the necessary modules
+from multiprocessing import shared_memory
+from .rrt import check_hit
+import numpy as np
+import weakref
+import heapq
+import time
+
+# The header holds the version counter, node count, edge count, map rows, map columns and generation
+header_fields = 6
+# The largest name of a successor segment in bytes
+successor_name_size = 64
+
+
+# Obtains the arrays of the shared memory segment as a list of (name, data type, shape)
+def _segment_layout(node_count, edge_count, rows, columns):
+    # Returns the arrays in the order they are laid out in the segment
+    return [('header', np.int64, (header_fields,)),
+            ('successor_name', np.uint8, (successor_name_size,)),
+            ('node_coordinates', np.int32, (node_count, 2)),
+            ('adjacency_pointers', np.int64, (node_count + 1,)),
+            ('adjacency_nodes', np.int32, (2 * edge_count,)),
+            ('adjacency_edges', np.int32, (2 * edge_count,)),
+            ('edge_lengths', np.float64, (edge_count,)),
+            ('blocked_mask', np.uint8, (edge_count,)),
+            ('world_map', np.uint8, (rows, columns))]
+
+
+# Obtains the byte offsets of the arrays of the segment and its total size
+def _segment_offsets(layout):
+    # The dictionary mapping array names to their offsets
+    offset_dict = {}
+    # The offset of the next array
+    offset = 0
+    # Iterating through the arrays
+    for name, dtype, shape in layout:
+        # We store the offset of the array
+        offset_dict[name] = offset
+        # Every array starts on an eight byte boundary so that the counters are aligned
+        offset += -(-int(np.prod(shape)) * np.dtype(dtype).itemsize // 8) * 8
+    # Returns the offsets and the total size (a segment can't be empty)
+    return offset_dict, max(offset, 1)
+
+
+# Class SharedRoadmap lets worker processes attach to a published roadmap without copying it
+# The segment is sized for the roadmap when it is published so a roadmap that grows is republished into a successor
+# segment whose name is left in the old one for the workers to follow
+class SharedRoadmap(object):
+
+    # The class constructor maps the arrays of an open shared memory segment (use publish or attach instead)
+    # attachment_candidates is the number of visible roadmap nodes the start and goal are each attached to
+    def __init__(self, segment, integrated_prm=None, attachment_candidates=8):
+        # The integrated PRM is only held by the single writer
+        self.integrated_prm = integrated_prm
+        # We store the number of roadmap nodes the start and goal are attached to
+        self.attachment_candidates = attachment_candidates
+        # The segments the writer replaced with successors which are kept until the roadmap is unlinked
+        self.retired_segment_list = []
+        # The map last copied into the segment and the extents of the dynamic obstacles it held (writer only)
+        self.published_map_reference = None
+        self.published_obstacle_dict = {}
+        # We map the arrays of the segment
+        self._map_segment(segment)
+
+    # This function maps the arrays of the segment onto this object without copying them
+    def _map_segment(self, segment):
+        # We store the shared memory segment
+        self.segment = segment
+        # The name by which workers attach to the segment
+        self.name = segment.name
+        # We read the sizes from the header
+        node_count, edge_count, rows, columns = np.ndarray((header_fields,), np.int64, segment.buf)[1:5]
+        # We store the number of nodes and edges the segment was sized for
+        self.node_count = int(node_count)
+        self.edge_count = int(edge_count)
+        # We obtain the layout of the segment
+        layout = _segment_layout(self.node_count, self.edge_count, int(rows), int(columns))
+        offset_dict, _ = _segment_offsets(layout)
+        # Iterating through the arrays of the segment
+        for name, dtype, shape in layout:
+            # We map the array onto the segment without copying it
+            setattr(self, name, np.ndarray(shape, dtype, segment.buf, offset_dict[name]))
+
+    # This function obtains a roadmap node of the segment as a coordinate tuple
+    def _node(self, index):
+        # Returns the coordinates of the node
+        return int(self.node_coordinates[index, 0]), int(self.node_coordinates[index, 1])
+
+    # Creates a shared memory segment sized for the roadmap of the integrated PRM and writes its header
+    @staticmethod
+    def _create_segment(integrated_prm, map_shape, name, version, generation):
+        # We obtain the sizes of the arrays
+        node_count = len(integrated_prm.roadmap_node_list)
+        edge_count = len(integrated_prm.roadmap_edge_list)
+        rows, columns = map_shape
+        # We obtain the layout of the segment
+        _, segment_size = _segment_offsets(_segment_layout(node_count, edge_count, rows, columns))
+        # We create the shared memory segment
+        segment = shared_memory.SharedMemory(name=name, create=True, size=segment_size)
+        # We write the header
+        np.ndarray((header_fields,), np.int64, segment.buf)[:] = [version, node_count, edge_count, rows, columns,
+                                                                 generation]
+        # Returns the segment
+        return segment
+
+    # Opens an existing shared memory segment without taking ownership of it
+    @staticmethod
+    def _open_segment(name):
+        try:
+            # The segment belongs to the writer so this process shouldn't unlink it on exit
+            return shared_memory.SharedMemory(name=name, track=False)
+        except TypeError:
+            # Python versions before 3.13 always track the segment so we skip the registration while attaching
+            from multiprocessing import resource_tracker
+            register = resource_tracker.register
+            resource_tracker.register = lambda *arguments: None
+            try:
+                return shared_memory.SharedMemory(name=name)
+            finally:
+                resource_tracker.register = register
+
+    # Publishes the roadmap and the world map of the integrated PRM into a new shared memory segment
+    # With a robot footprint the configuration space holding the inflated obstacles is published instead of world_map
+    @staticmethod
+    def publish(integrated_prm, world_map, name=None):
+        # The workers check visibility against the same map as the integrated PRM
+        if integrated_prm.configuration_space is not None:
+            world_map = integrated_prm.configuration_space.c_space_map
+        # We create the shared memory segment
+        segment = SharedRoadmap._create_segment(integrated_prm, world_map.shape, name, 0, 0)
+        # We map the arrays onto the segment
+        shared_roadmap = SharedRoadmap(segment, integrated_prm)
+        # We copy the roadmap
+        shared_roadmap._write_roadmap()
+        # We copy the blocked edges and the world map
+        shared_roadmap._write_state(world_map)
+        # Returns the shared roadmap
+        return shared_roadmap
+
+    # Attaches to a roadmap published by another process
+    @staticmethod
+    def attach(name, attachment_candidates=8):
+        # We open the existing shared memory segment
+        shared_roadmap = SharedRoadmap(SharedRoadmap._open_segment(name), attachment_candidates=attachment_candidates)
+        # We move on to the latest segment if the roadmap was republished
+        shared_roadmap._follow_successors()
+        # Returns the shared roadmap
+        return shared_roadmap
+
+    # Copies the nodes, adjacency and edge lengths of the integrated PRM into the segment
+    def _write_roadmap(self):
+        # We number the roadmap nodes
+        node_index_dict = {node: i for i, node in enumerate(self.integrated_prm.roadmap_node_list)}
+        # We number the roadmap edges
+        edge_index_dict = {id(edge): i for i, edge in enumerate(self.integrated_prm.roadmap_edge_list)}
+        # We copy the node coordinates
+        self.node_coordinates[:] = np.array(self.integrated_prm.roadmap_node_list, dtype=np.int32).reshape(-1, 2)
+        # We copy the adjacency of every node in compressed sparse row form
+        position = 0
+        for i, node in enumerate(self.integrated_prm.roadmap_node_list):
+            # We store where the connections of the node begin
+            self.adjacency_pointers[i] = position
+            # Iterating through the connections of the node
+            for connect_node, edge_object in self.integrated_prm.roadmap_nodes_and_edge_dict[node]:
+                # We store the connected node and the edge connecting them
+                self.adjacency_nodes[position] = node_index_dict[connect_node]
+                self.adjacency_edges[position] = edge_index_dict[id(edge_object)]
+                position += 1
+        # We store where the connections of the last node end
+        self.adjacency_pointers[self.node_count] = position
+        # We copy the edge lengths
+        self.edge_lengths[:] = [edge.edge_length for edge in self.integrated_prm.roadmap_edge_list]
+
+    # Copies the blocked edges and the world map into the segment behind the version counter
+    # Given the dynamic obstacles of a map already copied only the regions of obstacles that were added, removed or
+    # changed since are copied (widened by the obstacle margin), otherwise the whole map is
+    def _write_state(self, world_map, dynamic_obstacle_list=None):
+        # The extents of every dynamic obstacle
+        obstacle_dict = {id(dynamic_obstacle): self._obstacle_extents(dynamic_obstacle)
+                         for dynamic_obstacle in (dynamic_obstacle_list if dynamic_obstacle_list is not None else
+                                                  self.integrated_prm.dynamic_obstacle_list)
+                         if dynamic_obstacle.obstacle_coordinate_list}
+        # The regions of the map to copy (None copies the whole map)
+        region_list = None
+        if (dynamic_obstacle_list is not None and self.published_map_reference is not None and
+                self.published_map_reference() is world_map):
+            # The regions of the obstacles that were removed or changed and of those that were added or changed
+            region_list = ([extents for key, extents in self.published_obstacle_dict.items()
+                            if obstacle_dict.get(key) != extents] +
+                           [extents for key, extents in obstacle_dict.items()
+                            if self.published_obstacle_dict.get(key) != extents])
+        # An odd version tells readers that a write is in progress
+        self.header[0] += 1
+        # We copy the blocked mask
+        self.blocked_mask[:] = [edge.dynamic_obstacle_overlap for edge in self.integrated_prm.roadmap_edge_list]
+        # We check if the whole map has to be copied
+        if region_list is None:
+            # We copy the world map as ones (free) and zeros (obstacles)
+            self.world_map[:] = np.asarray(world_map) > 0
+        else:
+            # The inflated obstacles reach the obstacle margin beyond the obstacles themselves
+            margin = self.integrated_prm.obstacle_margin
+            # Iterating through the changed regions
+            for extents in region_list:
+                # We clip the region to the map
+                min_row, max_row = max(extents[0] - margin, 0), min(extents[1] + margin, self.world_map.shape[0] - 1)
+                min_column = max(extents[2] - margin, 0)
+                max_column = min(extents[3] + margin, self.world_map.shape[1] - 1)
+                # We copy the region as ones (free) and zeros (obstacles)
+                self.world_map[min_row:max_row + 1, min_column:max_column + 1] = \
+                    np.asarray(world_map[min_row:max_row + 1, min_column:max_column + 1]) > 0
+        # An even version tells readers that the state is consistent again
+        self.header[0] += 1
+        # We remember the map without keeping it alive (maps that can't be referenced weakly are always fully copied)
+        try:
+            self.published_map_reference = weakref.ref(world_map)
+        except TypeError:
+            self.published_map_reference = None
+        self.published_obstacle_dict = obstacle_dict
+
+    # This function obtains the extents (min_y, max_y, min_x, max_x, coordinate count) of a dynamic obstacle
+    @staticmethod
+    def _obstacle_extents(dynamic_obstacle):
+        # We obtain the y and x coordinates of the obstacle
+        y_coordinates = [item[0] for item in dynamic_obstacle.obstacle_coordinate_list]
+        x_coordinates = [item[1] for item in dynamic_obstacle.obstacle_coordinate_list]
+        # The coordinate count detects obstacles that grew without changing their ranges
+        return (min(y_coordinates), max(y_coordinates), min(x_coordinates), max(x_coordinates),
+                len(dynamic_obstacle.obstacle_coordinate_list))
+
+    # This function republishes a roadmap that grew or shrank into a successor segment (writer only)
+    def _republish(self, world_map):
+        # The successor continues the version counter so that versions seen by the workers keep increasing
+        segment = self._create_segment(self.integrated_prm, world_map.shape, None, int(self.header[0]),
+                                       int(self.header[5]) + 1)
+        # We keep the header of the old segment to point the workers at the successor
+        old_header, old_successor_name = self.header, self.successor_name
+        # We write the roadmap and its state into the successor
+        self.retired_segment_list.append(self.segment)
+        self._map_segment(segment)
+        self._write_roadmap()
+        self._write_state(world_map)
+        # We store the name of the successor in the old segment behind its version counter
+        name_bytes = segment.name.encode()
+        if len(name_bytes) > successor_name_size:
+            raise Exception('The name of the successor segment is too long: ' + repr(segment.name))
+        old_header[0] += 1
+        old_successor_name[:len(name_bytes)] = np.frombuffer(name_bytes, dtype=np.uint8)
+        old_header[0] += 1
+
+    # This function moves a worker on to the latest segment if the roadmap was republished
+    def _follow_successors(self):
+        # We keep following until we reach a segment that hasn't been replaced
+        while True:
+            # We wait until no write is in progress before reading the name of the successor
+            self.version()
+            successor_name = bytes(self.successor_name).rstrip(b'\0').decode()
+            if not successor_name:
+                return
+            # We open the successor and release the old segment
+            segment = self._open_segment(successor_name)
+            self.close()
+            self._map_segment(segment)
+
+    # This function updates the blocked edges and the world map after the dynamic obstacles change (writer only)
+    # With a robot footprint the blockage is checked and published against the configuration space like find_path does
+    def update_blockage(self, dynamic_obstacle_list, world_map):
+        # Only the process that published the roadmap holds the integrated PRM
+        if self.integrated_prm is None:
+            raise Exception('Only the process that published the roadmap can update it')
+        # We update the edges which are blocked by dynamic obstacles and obtain the map the checks ran against
+        world_map = self.integrated_prm.refresh_blockage(world_map, dynamic_obstacle_list)
+        # A roadmap that grew or shrank since it was published no longer fits its segment
+        if (len(self.integrated_prm.roadmap_node_list) != self.node_count or
+                len(self.integrated_prm.roadmap_edge_list) != self.edge_count):
+            self._republish(world_map)
+        else:
+            # We publish the new state copying only the regions of the map that the dynamic obstacles changed
+            self._write_state(world_map, dynamic_obstacle_list)
+
+    # Obtains the current version of the roadmap state (waits while a write is in progress)
+    def version(self):
+        # We wait until no write is in progress
+        while True:
+            # We read the version counter
+            version = int(self.header[0])
+            # Even versions are consistent
+            if version % 2 == 0:
+                return version
+            # We give the writer a chance to finish
+            time.sleep(0)
+
+    # Finds the closest roadmap nodes visible from the coordinate as a dictionary of node indices and distances
+    def _find_attachments(self, coordinate):
+        # The dictionary of attached node indices and their distances
+        attachments = {}
+        # We obtain the distances to all the roadmap nodes
+        distances = np.hypot(self.node_coordinates[:, 0] - coordinate[0], self.node_coordinates[:, 1] - coordinate[1])
+        # Iterating through the roadmap nodes from the closest
+        for index in np.argsort(distances, kind='stable'):
+            # We stop once we have enough nodes as a single node may have all its edges blocked
+            if len(attachments) >= self.attachment_candidates:
+                break
+            # We check if the node is visible from the coordinate
+            if not check_hit(self.world_map, coordinate, self._node(index)):
+                # We attach the coordinate to the node
+                attachments[int(index)] = float(distances[index])
+        # Returns the attachments
+        return attachments
+
+    # Searches the shared roadmap for a path from start to goal given a snapshot of the blocked mask
+    def _search(self, blocked_mask, start, goal):
+        # We attach the start and goal to the roadmap
+        start_attachments = self._find_attachments(start)
+        goal_attachments = self._find_attachments(goal)
+        # The goal is represented by the index one past the last node
+        goal_index = self.node_count
+        # The cumulative path length to every node
+        node_cumulative_value = dict(start_attachments)
+        # This dictionary marks the node from which we arrived at every node
+        came_from = {}
+        # The set of nodes that have been expanded
+        closed_set = set()
+        # We initialize the heap with the roadmap nodes the start is attached to
+        node_heap = [(distance, index) for index, distance in start_attachments.items()]
+        heapq.heapify(node_heap)
+        # We iterate until the heap is empty
+        while node_heap:
+            # We pop the closest node from the heap
+            current_value, current_index = heapq.heappop(node_heap)
+            # We check if we have reached the goal
+            if current_index == goal_index:
+                # We trace the path back to the start
+                current_index = came_from[goal_index]
+                prm_path = [goal, self._node(current_index)]
+                while current_index in came_from:
+                    current_index = came_from[current_index]
+                    prm_path.append(self._node(current_index))
+                prm_path.append(start)
+                # Returns the path and its length
+                return prm_path[::-1], current_value
+            # We skip nodes that have already been expanded
+            if current_index in closed_set:
+                continue
+            closed_set.add(current_index)
+            # Nodes the goal is attached to connect straight to the goal
+            if current_index in goal_attachments:
+                # We obtain the cumulative path length till the goal
+                goal_value = current_value + goal_attachments[current_index]
+                # We check if this is the best path so far for the goal
+                if goal_value < node_cumulative_value.get(goal_index, float('Inf')):
+                    node_cumulative_value[goal_index] = goal_value
+                    came_from[goal_index] = current_index
+                    heapq.heappush(node_heap, (goal_value, goal_index))
+            # Iterating through the connections of the node
+            for position in range(self.adjacency_pointers[current_index], self.adjacency_pointers[current_index + 1]):
+                # We obtain the edge of the connection
+                edge_index = self.adjacency_edges[position]
+                # We can't travel along blocked edges
+                if blocked_mask[edge_index]:
+                    continue
+                # We obtain the connected node and the cumulative path length till it
+                connect_index = int(self.adjacency_nodes[position])
+                connect_value = current_value + self.edge_lengths[edge_index]
+                # We check if this is the best path so far for the connected node
+                if connect_value < node_cumulative_value.get(connect_index, float('Inf')):
+                    node_cumulative_value[connect_index] = connect_value
+                    came_from[connect_index] = current_index
+                    heapq.heappush(node_heap, (connect_value, connect_index))
+        # We failed to find a path
+        return [], []
+
+    # We use this function to obtain the path from start to goal against a consistent snapshot of the roadmap state
+    def find_path(self, start, goal):
+        # We measure the time at start
+        start_time = time.time()
+        # We retry until the state doesn't change while we search
+        while True:
+            # We move on to the latest segment if the roadmap was republished
+            self._follow_successors()
+            # We obtain the version of the state we search
+            version = self.version()
+            # We take a private copy of the blocked mask as it is small
+            blocked_mask = self.blocked_mask.copy()
+            # We search the roadmap
+            prm_path, path_length = self._search(blocked_mask, start, goal)
+            # The result is consistent if no write happened during the search
+            if int(self.header[0]) == version:
+                break
+        # We measure the time to perform the path planning
+        end_time = time.time()
+        # Returns the path, its length, the computation time and the version of the state searched
+        return prm_path, path_length, end_time-start_time, version
+
+    # This function releases the mapping of the segment in this process
+    def close(self):
+        # We drop the array views before the buffer can be released
+        for name, _, _ in _segment_layout(0, 0, 0, 0):
+            setattr(self, name, None)
+        # We close the segment and the segments it replaced
+        self.segment.close()
+        for segment in self.retired_segment_list:
+            segment.close()
+
+    # This function destroys the segment and the segments it replaced once every process has closed them (writer only)
+    # Workers that haven't followed a republished roadmap yet can't find its successor once this is called
+    def unlink(self):
+        # We unlink the segments
+        for segment in self.retired_segment_list + [self.segment]:
+            segment.unlink()
@@ -0,0 +1,300 @@
+# WorkloadRecorder Class logs the roadmap builds and path queries of a workload so that it can be replayed later
+# Created by the Dynamic Path Planner contributors
+# Date: 10/19/2026
+
+# importing the necessary modules
+from .grid_graph import free_space_mask, map_fingerprint
+import numpy as np
+import hashlib
+import random
+import struct
+import json
+import time
+import zlib
+
+# The bytes that begin every workload log
+log_magic = b'WKLD'
+# The version of the workload log format
+log_format_version = 2
+# The file header holds the magic bytes and the format version
+log_header = struct.Struct('<4sI')
+# Every record is framed by the length of its compressed payload
+record_header = struct.Struct('<I')
+# The payload begins with the length of the JSON document describing the record
+json_header = struct.Struct('<I')
+# The raw bytes of every array of the record follow the JSON document each framed by their length
+buffer_header = struct.Struct('<Q')
+# The kinds of numpy data types that arrays in the log may have (booleans, integers and floats)
+array_kinds = 'biuf'
+
+
+# Encodes a record as a JSON document in which arrays are replaced by references to raw buffers that follow it
+def encode_record(record):
+    # The raw bytes of the arrays in the order they are referenced
+    buffer_list = []
+
+    # Obtains the JSON form of a value
+    def encode(value):
+        # Arrays are stored as their raw bytes with their data type and shape in the document
+        if isinstance(value, np.ndarray):
+            if value.dtype.kind not in array_kinds:
+                raise Exception('Arrays of type ' + str(value.dtype) + ' can\'t be stored in a workload log')
+            buffer_list.append(np.ascontiguousarray(value).tobytes())
+            return {'__array__': len(buffer_list) - 1, 'dtype': value.dtype.str, 'shape': list(value.shape)}
+        # Dictionaries need string keys in JSON
+        if isinstance(value, dict):
+            if not all(isinstance(key, str) for key in value):
+                raise Exception('Only dictionaries with string keys can be stored in a workload log')
+            return {key: encode(item) for key, item in value.items()}
+        # Tuples are stored as lists
+        if isinstance(value, (list, tuple)):
+            return [encode(item) for item in value]
+        # Numpy scalars are stored as the python values they hold
+        if isinstance(value, np.generic) and value.dtype.kind in array_kinds:
+            return value.item()
+        # Any other value must be a JSON value
+        if value is None or isinstance(value, (bool, int, float, str)):
+            return value
+        raise Exception('Values of type ' + type(value).__name__ + ' can\'t be stored in a workload log')
+
+    # We encode the document
+    document = json.dumps(encode(record)).encode()
+    # Returns the framed document followed by the framed buffers
+    return b''.join([json_header.pack(len(document)), document] +
+                    [buffer_header.pack(len(buffer)) + buffer for buffer in buffer_list])
+
+
+# Decodes a record encoded via encode_record
+def decode_record(payload):
+    # We read the JSON document
+    document_length = json_header.unpack_from(payload)[0]
+    document = json.loads(payload[json_header.size:json_header.size + document_length].decode())
+    # We read the buffers that follow it
+    buffer_list = []
+    offset = json_header.size + document_length
+    while offset < len(payload):
+        buffer_length = buffer_header.unpack_from(payload, offset)[0]
+        offset += buffer_header.size
+        buffer_list.append(payload[offset:offset + buffer_length])
+        offset += buffer_length
+
+    # Obtains the value of the JSON form
+    def decode(value):
+        # We rebuild the arrays referenced by the document
+        if isinstance(value, dict) and '__array__' in value:
+            dtype = np.dtype(value['dtype'])
+            if dtype.kind not in array_kinds:
+                raise Exception('The workload log holds an array of unsupported type ' + str(dtype))
+            return np.frombuffer(buffer_list[value['__array__']], dtype=dtype).reshape(value['shape']).copy()
+        if isinstance(value, dict):
+            return {key: decode(item) for key, item in value.items()}
+        if isinstance(value, list):
+            return [decode(item) for item in value]
+        return value
+
+    # Returns the record
+    return decode(document)
+
+
+# Appends a record to the log as a length framed, zlib compressed JSON document with its raw array buffers
+def write_record(log_file, record):
+    # We compress the encoded record
+    payload = zlib.compress(encode_record(record))
+    # We write the frame and the payload together so that a crash can only truncate the last record
+    log_file.write(record_header.pack(len(payload)) + payload)
+
+
+# Reads the records of a workload log in order (a truncated final record is ignored)
+def read_records(file_path):
+    # We open the log for reading
+    with open(file_path, 'rb') as log_file:
+        # We check the file header
+        magic, version = log_header.unpack(log_file.read(log_header.size))
+        if magic != log_magic or version != log_format_version:
+            raise Exception('The file is not a workload log of a supported version')
+        # We read the records until the end of the file
+        while True:
+            # We read the length of the payload
+            frame = log_file.read(record_header.size)
+            if len(frame) < record_header.size:
+                return
+            # We read the payload
+            payload_length = record_header.unpack(frame)[0]
+            payload = log_file.read(payload_length)
+            if len(payload) < payload_length:
+                return
+            # We yield the decoded record
+            yield decode_record(zlib.decompress(payload))
+
+
+# Obtains a path as a list of coordinate tuples so that paths from different planners can be compared
+def path_summary(path):
+    # Returns the coordinates as tuples of floats
+    return [tuple(float(value) for value in coordinate) for coordinate in path]
+
+
+# Class WorkloadRecorder runs the planners on behalf of the caller and appends their inputs and results to a log
+class WorkloadRecorder(object):
+
+    # The class constructor opens the log for appending (seed makes the seeds given to the planners repeatable)
+    def __init__(self, file_path, seed=None):
+        # We open the log for appending
+        self.log_file = open(file_path, 'ab')
+        # A new log begins with the file header
+        if self.log_file.tell() == 0:
+            self.log_file.write(log_header.pack(log_magic, log_format_version))
+        # The random number generator from which the planners are seeded
+        self.seed_generator = random.Random(seed)
+        # The keys of the maps, obstacles and landmark tables already in the log
+        self.blob_keys = set()
+        # The number of roadmaps built so far
+        self.prm_count = 0
+        # The identifiers of the roadmaps that were built via the recorder
+        self.prm_id_dict = {}
+        # The time at which the recording started
+        self.start_time = time.time()
+        # Appending to an existing log starts a new session in which the roadmap identifiers start over
+        self._write({'type': 'session'})
+
+    # This function appends a record stamped with its time since the recording started unless it is already stamped
+    def _write(self, record):
+        # We stamp the record
+        record.setdefault('time', time.time() - self.start_time)
+        # We append the record
+        write_record(self.log_file, record)
+        # We flush the log so that the record survives a crash
+        self.log_file.flush()
+
+    # This function stores a blob once per session and returns its key
+    def _store_blob(self, key, data):
+        # We only write blobs which aren't in the log yet
+        if key not in self.blob_keys:
+            self._write({'type': 'blob', 'key': key, 'data': data})
+            self.blob_keys.add(key)
+        # Returns the key of the blob
+        return key
+
+    # This function stores the free space of the map and returns its key
+    def _store_map(self, map_matrix):
+        # We obtain the free space of the map
+        free_mask = free_space_mask(map_matrix)
+        # Returns the key of the map
+        return self._store_blob('map:' + map_fingerprint(free_mask),
+                                {'shape': list(free_mask.shape), 'free_mask': np.packbits(free_mask)})
+
+    # This function stores the coordinates of the dynamic obstacles and returns their key
+    def _store_obstacles(self, dynamic_obstacle_list):
+        # We obtain the coordinates of every obstacle
+        coordinate_arrays = [np.array(obstacle.obstacle_coordinate_list, dtype=np.int32).reshape(-1, 2)
+                             for obstacle in dynamic_obstacle_list]
+        # The key identifies the coordinates of every obstacle
+        digest = hashlib.sha1()
+        for coordinate_array in coordinate_arrays:
+            digest.update(struct.pack('<I', len(coordinate_array)) + coordinate_array.tobytes())
+        # Returns the key of the obstacles
+        return self._store_blob('obstacles:' + digest.hexdigest(), coordinate_arrays)
+
+    # This function stores the landmark tables and returns their key
+    def _store_landmarks(self, landmark_heuristic):
+        # There isn't a key without landmark tables
+        if landmark_heuristic is None:
+            return None
+        # The landmarks and the map they were computed for identify the tables
+        key = 'landmarks:' + landmark_heuristic.map_fingerprint + ':' + hashlib.sha1(
+            repr(landmark_heuristic.landmark_list).encode()).hexdigest()
+        # Returns the key of the landmark tables which are stored as arrays
+        return self._store_blob(key, landmark_heuristic.to_arrays())
+
+    # This function seeds the random number generator before running a planner and returns the seed
+    def _next_seed(self):
+        # We draw the seed
+        seed = self.seed_generator.getrandbits(32)
+        # We seed the random number generator used by the planners
+        random.seed(seed)
+        # Returns the seed
+        return seed
+
+    # This function builds an integrated PRM and records the build
+    def build_prm(self, world_map, **prm_arguments):
+        # We import the planner on first use
+        from .IntegratedPRM import IntegratedPRM
+        # The record of the build
+        record = {'type': 'build_prm', 'map': self._store_map(world_map), 'arguments': prm_arguments,
+                  'prm_id': self.prm_count, 'seed': self._next_seed()}
+        # We build the roadmap and stamp the record with the time it was issued at
+        start_time = time.time()
+        record['time'] = start_time - self.start_time
+        integrated_prm = IntegratedPRM(world_map, **prm_arguments)
+        record['duration'] = time.time() - start_time
+        # We record the build
+        record['result'] = (len(integrated_prm.roadmap_node_list), len(integrated_prm.roadmap_edge_list))
+        self._write(record)
+        # We identify the roadmap by its number
+        self.prm_id_dict[id(integrated_prm)] = self.prm_count
+        self.prm_count += 1
+        # Returns the roadmap
+        return integrated_prm
+
+    # This function runs a query on a roadmap built via the recorder and records it
+    def prm_find_path(self, integrated_prm, map_matrix, dynamic_obstacle_list, start, goal):
+        # Only roadmaps built via the recorder can be replayed
+        if id(integrated_prm) not in self.prm_id_dict:
+            raise Exception('The roadmap was not built via this workload recorder')
+        # The record of the query
+        record = {'type': 'prm', 'prm_id': self.prm_id_dict[id(integrated_prm)], 'map': self._store_map(map_matrix),
+                  'obstacles': self._store_obstacles(dynamic_obstacle_list), 'start': start, 'goal': goal,
+                  'seed': self._next_seed()}
+        # We run the query and stamp the record with the time it was issued at
+        start_time = time.time()
+        record['time'] = start_time - self.start_time
+        result = integrated_prm.find_path(map_matrix, dynamic_obstacle_list, start, goal)
+        record['duration'] = time.time() - start_time
+        # We record the path and its length
+        record['result'] = (path_summary(result[0]), result[1])
+        self._write(record)
+        # Returns the result of the query
+        return result
+
+    # This function runs an A* query and records it
+    def a_star_find_path(self, map_matrix, start, goal, landmark_heuristic=None, **a_star_arguments):
+        # We import the planner on first use
+        from . import a_star
+        # The record of the query
+        record = {'type': 'a_star', 'map': self._store_map(map_matrix), 'start': start, 'goal': goal,
+                  'landmarks': self._store_landmarks(landmark_heuristic), 'arguments': a_star_arguments,
+                  'seed': self._next_seed()}
+        # We run the query and stamp the record with the time it was issued at
+        start_time = time.time()
+        record['time'] = start_time - self.start_time
+        result = a_star.find_path(map_matrix, start, goal, landmark_heuristic, **a_star_arguments)
+        record['duration'] = time.time() - start_time
+        # We record the path and its length
+        record['result'] = (path_summary(result[0]), result[1])
+        self._write(record)
+        # Returns the result of the query
+        return result
+
+    # This function runs an RRT query and records it
+    def rrt_find_path(self, map_matrix, start, goal, rrt_growth_limit, terminal_goal_distance, **rrt_arguments):
+        # We import the planner on first use
+        from . import rrt
+        # The record of the query
+        record = {'type': 'rrt', 'map': self._store_map(map_matrix), 'start': start, 'goal': goal,
+                  'arguments': dict(rrt_arguments, rrt_growth_limit=rrt_growth_limit,
+                                    terminal_goal_distance=terminal_goal_distance),
+                  'seed': self._next_seed()}
+        # We run the query and stamp the record with the time it was issued at
+        start_time = time.time()
+        record['time'] = start_time - self.start_time
+        result = rrt.find_path(map_matrix, start, goal, rrt_growth_limit, terminal_goal_distance, **rrt_arguments)
+        record['duration'] = time.time() - start_time
+        # We record the path and its length
+        record['result'] = (path_summary(result[0]), result[1])
+        self._write(record)
+        # Returns the result of the query
+        return result
+
+    # This function closes the log
+    def close(self):
+        # We close the log file
+        self.log_file.close()
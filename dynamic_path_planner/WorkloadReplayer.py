@@ -0,0 +1,168 @@
+# WorkloadReplayer Class re-executes a recorded workload log and compares its timings and paths with the recording
+# Created by the Dynamic Path Planner contributors
+# Date: 10/19/2026
+
+# importing the necessary modules
+from .WorkloadRecorder import read_records, path_summary
+from .DynamicObstacle import DynamicObstacle
+import numpy as np
+import argparse
+import random
+import json
+import math
+import time
+
+
+# Obtains a percentile of a list of values (zero for an empty list)
+def percentile(value_list, fraction):
+    # We sort the values
+    value_list = sorted(value_list)
+    # There isn't a percentile of an empty list
+    if not value_list:
+        return 0
+    # Returns the value at the nearest rank
+    return value_list[max(int(math.ceil(fraction * len(value_list))) - 1, 0)]
+
+
+# Class WorkloadReplayer replays the records of a workload log in order with the seeds they were recorded with
+class WorkloadReplayer(object):
+
+    # The class constructor takes in the path of the workload log
+    def __init__(self, file_path):
+        # We store the path of the log
+        self.file_path = file_path
+
+    # This function rebuilds a blob stored in the log
+    @staticmethod
+    def _load_blob(key, data):
+        # The kind of blob is the first part of its key
+        kind = key.split(':')[0]
+        # Maps are stored as their bit packed free space
+        if kind == 'map':
+            shape = data['shape']
+            # We rebuild the map with obstacles as zeros and free space as 255
+            return np.unpackbits(data['free_mask'], count=shape[0] * shape[1]).reshape(shape) * np.uint8(255)
+        # Dynamic obstacles are stored as arrays of their coordinates
+        if kind == 'obstacles':
+            return [DynamicObstacle([tuple(coordinate) for coordinate in coordinate_array.tolist()])
+                    for coordinate_array in data]
+        # Landmark tables are stored as arrays
+        if kind == 'landmarks':
+            # We import the landmark heuristic on first use
+            from .LandmarkHeuristic import LandmarkHeuristic
+            return LandmarkHeuristic.from_arrays(data)
+        raise Exception('Unknown blob in the workload log: ' + repr(key))
+
+    # This function replays a single record and returns its result
+    @staticmethod
+    def _replay_record(record, blob_dict, prm_dict):
+        # We seed the random number generator used by the planners as during the recording
+        random.seed(record['seed'])
+        # The coordinates were stored as lists
+        start = tuple(record['start']) if 'start' in record else None
+        goal = tuple(record['goal']) if 'goal' in record else None
+        # We check the type of the record
+        if record['type'] == 'build_prm':
+            # We import the planner on first use
+            from .IntegratedPRM import IntegratedPRM
+            # We rebuild the roadmap
+            integrated_prm = IntegratedPRM(blob_dict[record['map']], **record['arguments'])
+            prm_dict[record['prm_id']] = integrated_prm
+            # Returns the size of the roadmap
+            return len(integrated_prm.roadmap_node_list), len(integrated_prm.roadmap_edge_list)
+        elif record['type'] == 'prm':
+            # We run the query on the rebuilt roadmap
+            path, path_length = prm_dict[record['prm_id']].find_path(blob_dict[record['map']],
+                                                                     blob_dict[record['obstacles']],
+                                                                     start, goal)[:2]
+        elif record['type'] == 'a_star':
+            # We import the planner on first use
+            from . import a_star
+            # We run the A* query
+            path, path_length = a_star.find_path(blob_dict[record['map']], start, goal,
+                                                 blob_dict.get(record['landmarks']), **record['arguments'])[:2]
+        else:
+            # We import the planner on first use
+            from . import rrt
+            # We run the RRT query
+            path, path_length = rrt.find_path(blob_dict[record['map']], start, goal,
+                                              **record['arguments'])[:2]
+        # Returns the path and its length
+        return path_summary(path), path_length
+
+    # This function replays the log as fast as possible or at the pacing of the recording and returns the comparisons
+    def replay(self, paced=False):
+        # The list of comparisons between the recorded and replayed records
+        comparison_list = []
+        # The blobs of the log by their key
+        blob_dict = {}
+        # The rebuilt roadmaps by their identifier
+        prm_dict = {}
+        # The time at which the current session started replaying and the time it started at in the recording
+        session_start_time = time.time()
+        session_offset = 0
+        # Iterating through the records of the log
+        for index, record in enumerate(read_records(self.file_path)):
+            # We check the type of the record
+            if record['type'] == 'session':
+                # Roadmap identifiers start over with every session
+                prm_dict = {}
+                # The sessions are replayed one after the other
+                session_start_time = time.time()
+                session_offset = record['time']
+                continue
+            elif record['type'] == 'blob':
+                # We rebuild the blob
+                blob_dict[record['key']] = self._load_blob(record['key'], record['data'])
+                continue
+            # At the original pacing we wait until the record was issued during the recording
+            if paced:
+                time.sleep(max(0, record['time'] - session_offset - (time.time() - session_start_time)))
+            # We replay the record
+            start_time = time.time()
+            result = self._replay_record(record, blob_dict, prm_dict)
+            duration = time.time() - start_time
+            # The result is compared in the JSON form it was recorded in
+            result = json.loads(json.dumps(result))
+            # We compare the replayed record with the recording
+            comparison_list.append({'index': index, 'type': record['type'], 'recorded_duration': record['duration'],
+                                    'replayed_duration': duration, 'matches': result == record['result'],
+                                    'recorded_result': record['result'], 'replayed_result': result})
+        # Returns the comparisons
+        return comparison_list
+
+    # This function summarizes the comparisons of a replay
+    @staticmethod
+    def summarize(comparison_list):
+        # The recorded and replayed durations
+        recorded_durations = [comparison['recorded_duration'] for comparison in comparison_list]
+        replayed_durations = [comparison['replayed_duration'] for comparison in comparison_list]
+        # Returns the summary
+        return {'records': len(comparison_list),
+                'mismatches': [comparison['index'] for comparison in comparison_list if not comparison['matches']],
+                'recorded_total': sum(recorded_durations), 'replayed_total': sum(replayed_durations),
+                'recorded_p50': percentile(recorded_durations, 0.5),
+                'replayed_p50': percentile(replayed_durations, 0.5),
+                'recorded_p95': percentile(recorded_durations, 0.95),
+                'replayed_p95': percentile(replayed_durations, 0.95)}
+
+
+# Entry point of the replay command which returns zero if every replayed result matches the recording
+def main(argv=None):
+    # We parse the command line arguments
+    parser = argparse.ArgumentParser(prog='plan-replay',
+                                     description='Replay a recorded workload log and compare it with the recording.')
+    parser.add_argument('log', help='workload log written by WorkloadRecorder')
+    parser.add_argument('--paced', action='store_true', help='replay at the pacing of the recording')
+    arguments = parser.parse_args(argv)
+    # We replay the log
+    comparison_list = WorkloadReplayer(arguments.log).replay(arguments.paced)
+    # We write a line for every record
+    for comparison in comparison_list:
+        print(json.dumps({key: comparison[key] for key in ('index', 'type', 'recorded_duration',
+                                                           'replayed_duration', 'matches')}))
+    # We write the summary
+    summary = WorkloadReplayer.summarize(comparison_list)
+    print(json.dumps(summary))
+    # Returns the exit status
+    return 0 if not summary['mismatches'] else 1
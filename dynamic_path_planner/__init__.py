@@ -0,0 +1,10 @@
+# Dynamic path planning with A*, RRT and the integrated probabilistic roadmap
+# Created by the Dynamic Path Planner contributors
+# Date: 10/19/2026
+
+# The planners live in their own modules (dynamic_path_planner.a_star, dynamic_path_planner.rrt and
+# dynamic_path_planner.IntegratedPRM) and are not imported here so that importing the package stays cheap.
+# scipy, sklearn, matplotlib and PIL are only imported by the functions that need them on first use.
+
+# The version of the package
+__version__ = '1.0.0'
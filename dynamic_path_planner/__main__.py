@@ -0,0 +1,10 @@
+# Allows the command line interface to be run via python -m dynamic_path_planner
+# Created by the Dynamic Path Planner contributors
+# Date: 10/19/2026
+
+# importing the necessary modules
+from .cli import main
+import sys
+
+# We exit with the status returned by the command line interface
+sys.exit(main())
@@ -3,8 +3,10 @@
 # Date: 3/9/2019
 
 # importing the necessary modules
+from .ConfigurationSpace import planning_map
 import numpy as np
 import heapq as hq
+import warnings
 import time
 import math
 
@@ -14,11 +16,33 @@ def euclidean_distance(a, b):
     return math.sqrt((b[0] - a[0]) ** 2 + (b[1] - a[1]) ** 2)
 
 
-# Finds the shortest path via A* algorithm
-def find_path(map_matrix, start, goal):
+# Finds the shortest path via A* algorithm (landmark_heuristic is an optional precomputed LandmarkHeuristic)
+# robot_footprint is an optional robot radius or footprint mask against whose cached configuration space we plan
+# search_mask is an optional boolean array of the map's shape outside of which cells are never expanded or a tuple of
+# (mask, (row offset, column offset)) whose mask only covers the box of the map starting at the offset
+# configuration_space is an optional ConfigurationSpace of the static map into which dynamic_obstacle_list is stamped
+def find_path(map_matrix, start, goal, landmark_heuristic=None, robot_footprint=None, search_mask=None,
+              configuration_space=None, dynamic_obstacle_list=None):
 
     # We measure the time at start
     start_time = time.time()
+    # We plan over the map with obstacles inflated by the footprint if the robot has one
+    map_matrix = planning_map(map_matrix, robot_footprint, configuration_space, dynamic_obstacle_list)
+    # A search mask covering a box of the map comes with the offset of the box
+    mask_offset = (0, 0)
+    if isinstance(search_mask, tuple):
+        search_mask, mask_offset = search_mask
+    # Euclidean distance is the default heuristic
+    heuristic = euclidean_distance
+    # We check if landmark distances were precomputed for this map
+    if landmark_heuristic is not None:
+        # The landmark bounds are only valid if no cell has been freed since they were computed
+        if landmark_heuristic.is_admissible_for_map_object(map_matrix):
+            # We use the landmark bounds towards the goal as the heuristic
+            heuristic = landmark_heuristic.heuristic_to(goal)
+        else:
+            # Warning that the landmark tables are stale for this map
+            warnings.warn('Landmark tables are not valid for this map, falling back to the euclidean heuristic')
     # Creates an unordered empty set
     close_set = set()
     # declares an empty object (key-value pairs)
@@ -26,9 +50,15 @@ def find_path(map_matrix, start, goal):
     # The g-score of the start positioning (key-value pairs)
     g_score = {start: 0}
     # The f-score of the start positioning (key-value pairs)
-    f_score = {start: euclidean_distance(start, goal)}
+    f_score = {start: heuristic(start, goal)}
     # The open heap in which the coordinates to be expanded
     open_heap = []
+    # An infinite heuristic at the start shows that the goal lies in a different connected region
+    if f_score[start] == float('Inf'):
+        # We measure the time to perform the path planning
+        end_time = time.time()
+        # We return an empty array to show that there isn't a path, infinity and run time
+        return [], float('Inf'), end_time-start_time, []
     # Push the starting coordinates and its f-score
     hq.heappush(open_heap, (f_score[start], start))
     # The eight neighbour positions to consider (relative positioning)
@@ -78,6 +108,13 @@ def find_path(map_matrix, start, goal):
                     if map_matrix[neighbor[0], neighbor[1]] == 0:
                         # stop further evaluation as neighbor is an obstacle
                         continue
+                    # Checks if the neighbor lies outside the region we are allowed to search
+                    if search_mask is not None and not (
+                            0 <= neighbor[0] - mask_offset[0] < search_mask.shape[0] and
+                            0 <= neighbor[1] - mask_offset[1] < search_mask.shape[1] and
+                            search_mask[neighbor[0] - mask_offset[0], neighbor[1] - mask_offset[1]]):
+                        # stop further evaluation as neighbor is outside the search region
+                        continue
                 else:
                     # stop further evaluation as map_matrix bound x walls
                     continue
@@ -89,14 +126,14 @@ def find_path(map_matrix, start, goal):
             if neighbor in close_set and tentative_g_score >= g_score.get(neighbor, 0):
                 # stop further evaluation as the tentative g-score is greater than that via a previous route
                 continue
-            # If the tentative score is less or the neighbor is not in the open heap
-            elif tentative_g_score < g_score.get(neighbor, 0) or neighbor not in [i[1]for i in open_heap]:
+            # If the neighbor hasn't been reached before (not in the open heap) or the tentative score is less
+            elif neighbor not in g_score or tentative_g_score < g_score[neighbor]:
                 # We specify that we reached the neighbor from the current coordinate
                 came_from[neighbor] = current_coordinate
                 # We update the g-score of the neighbor
                 g_score[neighbor] = tentative_g_score
                 # We update the f-score of the neighbor
-                f_score[neighbor] = tentative_g_score + euclidean_distance(neighbor, goal)
+                f_score[neighbor] = tentative_g_score + heuristic(neighbor, goal)
                 # We push the neighbor and its f-score to the open heap
                 hq.heappush(open_heap, (f_score[neighbor], neighbor))
 
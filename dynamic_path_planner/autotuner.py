@@ -0,0 +1,244 @@
+# This python file tunes the integrated PRM parameters for a map and query workload via successive halving
+# Created by the Dynamic Path Planner contributors
+# Date: 10/19/2026
+
+# importing the necessary modules
+from .grid_graph import free_space_mask
+import numpy as np
+import tracemalloc
+import argparse
+import random
+import json
+import math
+import time
+
+# The values tried for each parameter (node_value is the node spacing in 'density' mode and node count otherwise)
+# max_neighbor_distance is always a fraction of the map size as it is in 'density' mode
+default_search_space = {'mode': ['density', 'count'],
+                        'density_node_value': [6, 8, 10, 12, 16, 20, 24],
+                        'count_node_value': [250, 500, 1000, 2000, 4000],
+                        'node_neighbors': [4, 6, 8, 10, 15, 20],
+                        'max_neighbor_distance': [0.1, 0.25, 0.5, 1.0]}
+# The objectives of the pareto set and whether they are maximized
+objective_list = [('build_time', False), ('p95_latency', False), ('memory', False), ('success_rate', True)]
+
+
+# Samples the query workload as random pairs of free cells of the map
+def sample_queries(world_map, query_count, seed=None):
+    # The random number generator of the queries
+    random_generator = random.Random(seed)
+    # We obtain the free cells of the map
+    free_cells = np.argwhere(free_space_mask(world_map))
+    # Returns the pairs of start and goal coordinates
+    return [tuple(tuple(int(value) for value in free_cells[random_generator.randrange(len(free_cells))])
+                  for _ in range(2)) for _ in range(query_count)]
+
+
+# Samples distinct configurations of the integrated PRM from the search space
+def sample_configurations(configuration_count, search_space=None, seed=None):
+    # We use the default search space if none was provided
+    search_space = default_search_space if search_space is None else search_space
+    # The random number generator of the configurations
+    random_generator = random.Random(seed)
+    # The list of sampled configurations
+    configuration_list = []
+    # We limit the number of attempts in case the search space is smaller than the number of configurations
+    for _ in range(100 * configuration_count):
+        # We stop once we have sampled enough configurations
+        if len(configuration_list) >= configuration_count:
+            break
+        # We sample a mode and the node values that apply to it
+        mode = random_generator.choice(search_space['mode'])
+        configuration = {'mode': mode,
+                         'node_value': random_generator.choice(search_space[mode + '_node_value']),
+                         'node_neighbors': random_generator.choice(search_space['node_neighbors']),
+                         'max_neighbor_distance': random_generator.choice(search_space['max_neighbor_distance'])}
+        # We only keep new configurations
+        if configuration not in configuration_list:
+            configuration_list.append(configuration)
+    # Returns the configurations
+    return configuration_list
+
+
+# Obtains the pareto rank of every evaluation where rank zero holds the evaluations that no other evaluation dominates
+def pareto_ranks(evaluation_list):
+    # We orient every objective so that smaller is better
+    points = [[-evaluation[name] if maximized else evaluation[name] for name, maximized in objective_list]
+              for evaluation in evaluation_list]
+    # The ranks of the evaluations
+    ranks = [None] * len(points)
+    # The rank currently being assigned
+    rank = 0
+    # We peel off the non dominated evaluations until every evaluation is ranked
+    while None in ranks:
+        # The evaluations that remain to be ranked
+        remaining = [i for i in range(len(points)) if ranks[i] is None]
+        # Iterating through the remaining evaluations
+        front = [i for i in remaining if not any(
+            all(a <= b for a, b in zip(points[j], points[i])) and points[j] != points[i] for j in remaining)]
+        # We assign the rank to the front
+        for i in front:
+            ranks[i] = rank
+        rank += 1
+    # Returns the ranks
+    return ranks
+
+
+# Loads the queries of a workload from a log written by WorkloadRecorder or a text file of 'y,x y,x' lines
+# Text lines hold the start and goal of a query and anything after a '#' is a comment
+def load_workload(file_path):
+    # We import the workload log reader and the coordinate parser on first use
+    from .WorkloadRecorder import log_magic, read_records
+    from .cli import parse_coordinate
+    # We check if the file is a workload log
+    with open(file_path, 'rb') as workload_file:
+        is_log = workload_file.read(len(log_magic)) == log_magic
+    if is_log:
+        # Returns the start and goal of every recorded query
+        return [(tuple(int(value) for value in record['start']), tuple(int(value) for value in record['goal']))
+                for record in read_records(file_path) if 'start' in record]
+    # The list of queries in the text file
+    query_list = []
+    with open(file_path) as workload_file:
+        # Iterating through the lines without their comments
+        for line in workload_file:
+            fields = line.split('#')[0].split()
+            # We skip empty lines
+            if not fields:
+                continue
+            # Every line holds a start and a goal
+            if len(fields) != 2:
+                raise Exception('Workload lines need a start and a goal as y,x y,x: ' + repr(line.strip()))
+            query_list.append((parse_coordinate(fields[0]), parse_coordinate(fields[1])))
+    # Returns the queries
+    return query_list
+
+
+# Builds the roadmap of a configuration repeatably from the seed
+def build_roadmap(world_map, configuration, seed):
+    # We import the planner on first use
+    from .IntegratedPRM import IntegratedPRM
+    # We copy the configuration into the arguments of the integrated PRM
+    arguments = dict(configuration)
+    # The 'count' mode takes the neighbor distance as an actual distance so we scale the fraction by the map size
+    if configuration['mode'] == 'count':
+        arguments['max_neighbor_distance'] *= (world_map.shape[0] + world_map.shape[1]) / 2
+    # We seed the random number generator so that every configuration is built repeatably
+    random.seed(seed)
+    # Returns the roadmap
+    return IntegratedPRM(world_map, **arguments)
+
+
+# Builds the roadmap of a configuration and returns its state holding the roadmap, its metrics and query latencies
+def build_configuration(world_map, configuration, seed):
+    # We trace the memory allocated while building the roadmap
+    tracemalloc.start()
+    start_time = time.time()
+    integrated_prm = build_roadmap(world_map, configuration, seed)
+    build_time = time.time() - start_time
+    # The memory still held by the roadmap once it is built
+    memory = tracemalloc.get_traced_memory()[0]
+    tracemalloc.stop()
+    # Returns the state of the configuration
+    return {'configuration': configuration, 'seed': seed, 'integrated_prm': integrated_prm, 'build_time': build_time,
+            'memory': memory, 'latencies': [], 'successes': 0}
+
+
+# Runs more queries of the workload on a configuration and updates its metrics
+def evaluate_queries(world_map, state, query_list):
+    # Iterating through the queries
+    for start, goal in query_list:
+        # We run the query
+        path, _, computation_time, _ = state['integrated_prm'].find_path(world_map, [], start, goal)
+        # We record the latency and whether the query succeeded
+        state['latencies'].append(computation_time)
+        state['successes'] += 1 if path else 0
+    # We update the metrics of the configuration
+    state['p95_latency'] = float(np.percentile(state['latencies'], 95))
+    state['success_rate'] = state['successes'] / len(state['latencies'])
+
+
+# Tunes the integrated PRM for the map and query workload and returns the pareto set of configurations
+# Every rung runs eta times more queries on the best 1/eta of the configurations ranked by pareto rank along with
+# every configuration of the pareto set so that configurations winning on build time or memory aren't cut
+def autotune(world_map, query_list, configuration_list=None, initial_queries=5, eta=3, seed=None):
+    # We can't rank configurations without queries
+    if not query_list:
+        raise Exception('The workload needs at least one query')
+    # We sample the configurations if none were provided
+    if configuration_list is None:
+        configuration_list = sample_configurations(27, seed=seed)
+    # Every configuration gets a concrete seed so that a roadmap rebuilt in a later rung is the one evaluated before
+    seed_generator = random.Random(seed)
+    seed_list = [seed_generator.getrandbits(32) for _ in configuration_list]
+    # The number of queries the first rung runs
+    query_budget = min(initial_queries, len(query_list))
+    # The first rung builds, evaluates and frees every configuration in turn so that a single roadmap is held at once
+    state_list = []
+    for configuration, configuration_seed in zip(configuration_list, seed_list):
+        state = build_configuration(world_map, configuration, configuration_seed)
+        evaluate_queries(world_map, state, query_list[:query_budget])
+        state['integrated_prm'] = None
+        state_list.append(state)
+    # The number of queries every surviving configuration has run
+    queries_run = query_budget
+    # Iterating through the later rungs until every query has been run or a single configuration survives
+    while queries_run < len(query_list) and len(state_list) > 1:
+        # We rank the configurations by their pareto rank and then by success rate and latency
+        ranks = pareto_ranks(state_list)
+        order = sorted(range(len(state_list)), key=lambda i: (ranks[i], -state_list[i]['success_rate'],
+                                                               state_list[i]['p95_latency']))
+        # The best configurations and the whole pareto set survive while the roadmaps of the others are released
+        survivor_count = max(1, int(math.ceil(len(state_list) / eta)), ranks.count(0))
+        state_list = [state_list[i] for i in order[:survivor_count]]
+        # The next rung runs more queries
+        query_budget = min(query_budget * eta, len(query_list))
+        # Iterating through the surviving configurations
+        for state in state_list:
+            # A surviving roadmap is rebuilt from the same seed the first time it is needed again and kept after
+            if state['integrated_prm'] is None:
+                state['integrated_prm'] = build_roadmap(world_map, state['configuration'], state['seed'])
+            # We run the queries of the rung that the configuration hasn't run yet
+            evaluate_queries(world_map, state, query_list[queries_run:query_budget])
+        queries_run = query_budget
+    # We obtain the pareto set of the configurations that survived every rung
+    ranks = pareto_ranks(state_list)
+    # Returns the configurations of the pareto set and their metrics
+    return [{'configuration': state['configuration'], 'seed': state['seed'], 'build_time': state['build_time'],
+             'p95_latency': state['p95_latency'], 'memory': state['memory'], 'success_rate': state['success_rate'],
+             'queries': len(state['latencies'])} for state, rank in zip(state_list, ranks) if rank == 0]
+
+
+# Entry point of the autotune command which writes the pareto set of configurations as JSON lines
+def main(argv=None):
+    # We import the map loader of the command line interface
+    from .cli import load_map
+    # We parse the command line arguments
+    parser = argparse.ArgumentParser(prog='plan-autotune',
+                                     description='Tune the integrated PRM parameters for a map and query workload.')
+    parser.add_argument('--map', required=True, help='bitmap image (obstacles are zeros) or tiled .occ map file')
+    parser.add_argument('--queries', type=int, default=45, help='number of random queries in the workload')
+    parser.add_argument('--workload', default=None,
+                        help='WorkloadRecorder log or text file of "y,x y,x" queries used instead of random ones')
+    parser.add_argument('--configurations', type=int, default=27, help='number of configurations sampled')
+    parser.add_argument('--initial-queries', type=int, default=5, help='queries run by every configuration')
+    parser.add_argument('--eta', type=int, default=3, help='factor by which every rung cuts the configurations')
+    parser.add_argument('--seed', type=int, default=None, help='random seed for repeatable results')
+    arguments = parser.parse_args(argv)
+    # We load the map
+    world_map = load_map(arguments.map, 'uint8')
+    # We load the workload or sample it
+    if arguments.workload is not None:
+        query_list = load_workload(arguments.workload)
+    else:
+        query_list = sample_queries(world_map, arguments.queries, arguments.seed)
+    # We sample the configurations
+    configuration_list = sample_configurations(arguments.configurations, seed=arguments.seed)
+    # We tune the integrated PRM
+    pareto_list = autotune(world_map, query_list, configuration_list, arguments.initial_queries, arguments.eta,
+                           arguments.seed)
+    # We write a line for every configuration of the pareto set
+    for evaluation in pareto_list:
+        print(json.dumps(evaluation))
+    # Returns the exit status
+    return 0
@@ -0,0 +1,198 @@
+# Headless command line interface that plans a single path and prints the result as JSON
+# Created by the Dynamic Path Planner contributors
+# Date: 10/19/2026
+
+# importing the necessary modules
+from .ConfigurationSpace import planning_map
+from .grid_graph import path_with_ends, a_star_path
+import argparse
+import random
+import json
+import math
+import time
+import sys
+import os
+
+# The planners that can be selected
+planner_names = ['a_star', 'distance_field', 'rrt', 'prm', 'corridor', 'portfolio']
+
+
+# Parses a coordinate given as 'y,x'
+def parse_coordinate(text):
+    # We split the coordinate into its row and column
+    try:
+        y, x = text.split(',')
+        return int(y), int(x)
+    except ValueError:
+        raise argparse.ArgumentTypeError('coordinates must be given as y,x: ' + repr(text))
+
+
+# Converts numpy scalars and infinite values into values that can be written as JSON
+def json_value(value):
+    # We check if the value is a numpy scalar
+    if hasattr(value, 'item'):
+        value = value.item()
+    # Infinite and missing path lengths are written as null
+    if isinstance(value, list) or (isinstance(value, float) and not math.isfinite(value)):
+        return None
+    # Returns the value
+    return value
+
+
+# Loads the map from a bitmap image or a tiled occupancy grid file (.occ)
+def load_map(map_path, storage):
+    # We import the occupancy grid here to keep the start up of the interface cheap
+    from .OccupancyGrid import OccupancyGrid
+    # Tiled occupancy grid files are memory-mapped rather than loaded
+    if os.path.splitext(map_path)[1] == '.occ':
+        return OccupancyGrid.open(map_path, mode='r')
+    # Returns the occupancy grid read from the image (tiled grids are written next to the image)
+    return OccupancyGrid.from_image(map_path, storage, os.path.splitext(map_path)[0] + '.occ')
+
+
+# Builds the parser of the command line arguments
+def build_parser():
+    # We create the argument parser
+    parser = argparse.ArgumentParser(prog='plan', description='Plans a path over a map and prints it as JSON')
+    parser.add_argument('--map', required=True, help='bitmap image (obstacles are zeros) or tiled .occ map file')
+    parser.add_argument('--start', required=True, type=parse_coordinate, help='start coordinate as y,x')
+    parser.add_argument('--goal', required=True, type=parse_coordinate, help='goal coordinate as y,x')
+    parser.add_argument('--planner', choices=planner_names, default='prm', help='planner to run')
+    parser.add_argument('--storage', choices=['uint8', 'bits', 'tiled'], default='uint8',
+                        help='storage of the map loaded from an image')
+    parser.add_argument('--seed', type=int, default=None, help='random seed for repeatable results')
+    parser.add_argument('--robot-radius', type=float, default=None, help='robot radius by which obstacles inflate')
+    parser.add_argument('--landmarks', type=int, default=0,
+                        help='number of A* landmarks (persisted alongside the map), zero disables them')
+    parser.add_argument('--rrt-growth-limit', type=float, default=10, help='RRT growth limit')
+    parser.add_argument('--rrt-goal-distance', type=float, default=10, help='RRT distance required to reach the goal')
+    parser.add_argument('--prm-density', type=float, default=12, help='PRM node density')
+    parser.add_argument('--prm-neighbors', type=int, default=10, help='PRM node neighbors')
+    parser.add_argument('--corridor-width', type=float, default=20,
+                        help='initial width of the corridor around the PRM route searched by A*')
+    parser.add_argument('--portfolio-quality', type=float, default=1.5,
+                        help='largest ratio of path length to straight line distance the portfolio accepts')
+    parser.add_argument('--portfolio-deadline', type=float, default=None,
+                        help='seconds after which the portfolio returns its best path')
+    parser.add_argument('--prm-stretch', type=float, default=None,
+                        help='prune the PRM roadmap into a spanner whose paths stretch by at most this factor')
+    # Returns the parser
+    return parser
+
+
+# Runs the selected planner and returns the path, path length, computation time and extra details
+def run_planner(arguments, world_map):
+    # We check which planner was selected
+    if arguments.planner == 'a_star':
+        # We import the planner on first use
+        from . import a_star
+        from .LandmarkHeuristic import LandmarkHeuristic
+        # We load the landmark tables if they were requested
+        landmark_heuristic = None
+        if arguments.landmarks > 0:
+            landmark_heuristic = LandmarkHeuristic.load_or_build(world_map, arguments.map, arguments.landmarks)
+        # We run the A* algorithm
+        path, path_length, computation_time, expanded_nodes = a_star.find_path(
+            world_map, arguments.start, arguments.goal, landmark_heuristic, arguments.robot_radius)
+        # A* returns the path from the goal back to the cell two steps from the start so we turn it around
+        if path_length != float('Inf'):
+            path = a_star_path(planning_map(world_map, arguments.robot_radius), path, arguments.start, arguments.goal)
+        # Returns the path details
+        return path, path_length, computation_time, {'expanded_nodes': len(expanded_nodes)}
+    elif arguments.planner == 'distance_field':
+        # We import the planner on first use
+        from . import DistanceField
+        # We descend the distance field of the goal
+        path, path_length, computation_time, distance_field = DistanceField.find_path(
+            world_map, arguments.start, arguments.goal, arguments.robot_radius)
+        # Returns the path details
+        return path, path_length, computation_time, {}
+    elif arguments.planner == 'rrt':
+        # We import the planner on first use
+        from . import rrt
+        # We run the RRT algorithm
+        path, path_length, computation_time, branch_set, node_count = rrt.find_path(
+            world_map, arguments.start, arguments.goal, arguments.rrt_growth_limit, arguments.rrt_goal_distance,
+            robot_footprint=arguments.robot_radius)
+        # RRT returns the path from the goal back to the node after the start so we turn it around
+        if path:
+            path = path_with_ends(path[::-1], arguments.start, arguments.goal)
+        # Returns the path details
+        return path, path_length, computation_time, {'tree_nodes': node_count}
+    elif arguments.planner == 'portfolio':
+        # We import the planner on first use
+        from .PortfolioPlanner import PortfolioPlanner
+        # We create the portfolio which builds its roadmap up front
+        portfolio_planner = PortfolioPlanner(world_map, quality_threshold=arguments.portfolio_quality,
+                                             deadline=arguments.portfolio_deadline,
+                                             prm_arguments={'node_value': arguments.prm_density,
+                                                            'node_neighbors': arguments.prm_neighbors,
+                                                            'spanner_stretch': arguments.prm_stretch},
+                                             rrt_growth_limit=arguments.rrt_growth_limit,
+                                             rrt_goal_distance=arguments.rrt_goal_distance,
+                                             robot_footprint=arguments.robot_radius)
+        # We race the planners
+        path, path_length, computation_time, winner = portfolio_planner.find_path(
+            world_map, [], arguments.start, arguments.goal)
+        # We stop the workers of the portfolio
+        portfolio_planner.close()
+        # Returns the path details
+        return path, path_length, computation_time, {'winner': winner}
+    # We import the planner on first use
+    from .IntegratedPRM import IntegratedPRM
+    # We record the start time
+    start_time = time.time()
+    # We create an object of the integrated PRM algorithm
+    integrated_prm = IntegratedPRM(world_map, mode='density', node_value=arguments.prm_density,
+                                   node_neighbors=arguments.prm_neighbors, robot_footprint=arguments.robot_radius,
+                                   spanner_stretch=arguments.prm_stretch)
+    # We measure the time needed to build the roadmap
+    build_time = time.time() - start_time
+    # We check if A* should search a corridor around the route of the roadmap
+    if arguments.planner == 'corridor':
+        # We import the planner on first use
+        from . import corridor_planner
+        # We run A* in the corridor
+        path, path_length, computation_time, expanded_nodes = corridor_planner.find_path(
+            world_map, [], arguments.start, arguments.goal, integrated_prm, arguments.corridor_width)
+        # The corridor search returns its path like A* over the map the roadmap checks collisions against
+        if path_length != float('Inf'):
+            corridor_map = (world_map if integrated_prm.configuration_space is None
+                            else integrated_prm.configuration_space.c_space_map)
+            path = a_star_path(corridor_map, path, arguments.start, arguments.goal)
+        # Returns the path details
+        return path, path_length, computation_time, {'build_time': build_time, 'expanded_nodes': len(expanded_nodes)}
+    # We run the integrated PRM algorithm
+    path, path_length, computation_time, roadmap_edge_list = integrated_prm.find_path(
+        world_map, [], arguments.start, arguments.goal)
+    # Returns the path details
+    return path, path_length, computation_time, {'build_time': build_time,
+                                                 'roadmap_nodes': len(integrated_prm.roadmap_node_list),
+                                                 'roadmap_edges': len(roadmap_edge_list)}
+
+
+# Entry point of the plan command which returns zero if a path was found and one otherwise
+def main(argv=None):
+    # We parse the command line arguments
+    arguments = build_parser().parse_args(argv)
+    # We seed the random number generator if a seed was given
+    if arguments.seed is not None:
+        random.seed(arguments.seed)
+    # We load the map
+    world_map = load_map(arguments.map, arguments.storage)
+    # We run the selected planner
+    path, path_length, computation_time, details = run_planner(arguments, world_map)
+    # A path was found if its length is finite (a planner may return an empty list as the length of a failure)
+    success = isinstance(path_length, (int, float)) and math.isfinite(path_length)
+    # The result written as JSON
+    result = {'planner': arguments.planner, 'map': arguments.map, 'start': list(arguments.start),
+              'goal': list(arguments.goal), 'success': success,
+              'path': [[json_value(value) for value in coordinate] for coordinate in path],
+              'path_length': json_value(path_length), 'computation_time': computation_time}
+    # We add the details specific to the planner
+    result.update({key: json_value(value) for key, value in details.items()})
+    # We write the result on a single line
+    json.dump(result, sys.stdout)
+    sys.stdout.write('\n')
+    # Returns the exit status
+    return 0 if success else 1
@@ -0,0 +1,76 @@
+# This python file finds exact grid paths by running A* inside a corridor around the route of the integrated PRM
+# Created by the Dynamic Path Planner contributors
+# Date: 10/19/2026
+
+# importing the necessary modules
+from . import a_star
+import numpy as np
+import time
+import math
+
+
+# Rasterizes a corridor of the given width around the polyline as a boolean array covering the corridor's bounding box
+# and returns it with the offset of the box in the map as a search mask for A* (a full map array would be huge)
+def corridor_mask(map_shape, polyline, corridor_width):
+    # The half width of the corridor on either side of the polyline
+    half_width = corridor_width / 2
+    # The margin by which the bounding box of the polyline is grown
+    margin = int(math.ceil(half_width))
+    # We obtain the bounding box of the corridor clipped to the map
+    polyline = np.asarray(polyline, dtype=float).reshape(-1, 2)
+    min_row = max(int(math.floor(polyline[:, 0].min())) - margin, 0)
+    max_row = min(int(math.ceil(polyline[:, 0].max())) + margin, map_shape[0] - 1)
+    min_column = max(int(math.floor(polyline[:, 1].min())) - margin, 0)
+    max_column = min(int(math.ceil(polyline[:, 1].max())) + margin, map_shape[1] - 1)
+    # The cells of the bounding box that the polyline passes through
+    line_mask = np.zeros((max_row - min_row + 1, max_column - min_column + 1), dtype=bool)
+    # Iterating through the segments of the polyline
+    for segment_start, segment_end in zip(polyline[:-1], polyline[1:]):
+        # We sample the segment at least once per cell
+        samples = int(math.ceil(np.abs(segment_end - segment_start).max())) + 1
+        sample_rows = np.rint(np.linspace(segment_start[0], segment_end[0], samples)).astype(int) - min_row
+        sample_columns = np.rint(np.linspace(segment_start[1], segment_end[1], samples)).astype(int) - min_column
+        # We mark the cells that the segment passes through
+        line_mask[sample_rows, sample_columns] = True
+    # A polyline of a single point still marks its cell
+    line_mask[int(round(polyline[0, 0])) - min_row, int(round(polyline[0, 1])) - min_column] = True
+    # We import scipy on first use as it is slow to load
+    from scipy import ndimage
+    # The cells of the corridor lie within the half width of the polyline
+    mask = ndimage.distance_transform_edt(~line_mask) <= half_width
+    # Returns the corridor and the offset of its box
+    return mask, (min_row, min_column)
+
+
+# Finds an exact grid path by running A* in a corridor around the PRM route, widening it if no path exists inside
+# corridor_width is the initial width in cells which doubles for each of the widen_attempts before the full map is used
+def find_path(map_matrix, dynamic_obstacle_list, start, goal, integrated_prm, corridor_width=20, widen_attempts=2,
+              landmark_heuristic=None):
+    # We measure the time at start
+    start_time = time.time()
+    # We obtain the coarse route through the roadmap
+    prm_path, _, _, _ = integrated_prm.find_path(map_matrix, dynamic_obstacle_list, start, goal)
+    # The roadmap already checked the dynamic obstacles against its configuration space if the robot has a footprint
+    if integrated_prm.configuration_space is not None:
+        # The corridor is searched over the map with inflated obstacles
+        map_matrix = integrated_prm.configuration_space.c_space_map
+    # The list of nodes expanded across every search
+    expanded_node_list = []
+    # The corridor widths we try in order (a width of None searches the full map)
+    width_list = [corridor_width * 2 ** attempt for attempt in range(widen_attempts + 1)] if prm_path else []
+    # Iterating through the corridor widths and finally the full map
+    for width in width_list + [None]:
+        # We restrict the search to the corridor around the route
+        search_mask = None if width is None else corridor_mask(map_matrix.shape, prm_path, width)
+        # We run the A* algorithm inside the corridor
+        path, path_length, _, expanded_nodes = a_star.find_path(map_matrix, start, goal, landmark_heuristic,
+                                                                search_mask=search_mask)
+        # We add the expanded nodes
+        expanded_node_list.extend(expanded_nodes)
+        # We stop once a path has been found (A* returns an empty path with a finite length next to the start)
+        if path_length != float('Inf'):
+            break
+    # We measure the time to perform the path planning
+    end_time = time.time()
+    # Returns the path, path length, computation time and list of expanded nodes (shaped like the result of A*)
+    return path, path_length, end_time-start_time, expanded_node_list
@@ -0,0 +1,111 @@
+# This python file contains functions that treat the free cells of a map as a graph for grid based planners
+# Created by the Dynamic Path Planner contributors
+# Date: 10/19/2026
+
+# importing the necessary modules
+import numpy as np
+import hashlib
+import math
+
+# The four neighbour offsets that cover the eight connected grid once each as the graph is undirected
+half_neighbor_offsets = [(0, 1), (1, 0), (1, 1), (1, -1)]
+
+
+# Obtains a boolean array which is true at the free cells of the map (obstacles are zeros)
+def free_space_mask(map_matrix):
+    # Any non zero cell is considered as free space
+    return np.asarray(map_matrix) > 0
+
+
+# Computes a fingerprint of the free space of the map so that cached tables can detect a changed map
+def map_fingerprint(map_matrix):
+    # We obtain the free space of the map
+    free_mask = free_space_mask(map_matrix)
+    # The map dimensions are part of the fingerprint so that reshaped maps don't collide
+    digest = hashlib.sha1(repr(free_mask.shape).encode())
+    # We add the bit packed free space to the fingerprint
+    digest.update(np.packbits(free_mask).tobytes())
+    # Returns the fingerprint as a hexadecimal string
+    return digest.hexdigest()
+
+
+# Builds a sparse 8-connected graph over the free cells using the same step costs as A* (1 and root 2)
+def build_grid_graph(free_mask):
+    # We import scipy on first use as it is slow to load
+    from scipy.sparse import csr_matrix
+    # Obtains the number of rows and columns in the map
+    rows, columns = free_mask.shape
+    # Each cell is identified by its flattened index
+    cell_indices = np.arange(rows * columns).reshape(rows, columns)
+    # The lists which will hold the graph edges
+    sources = []
+    targets = []
+    costs = []
+    # Iterating through the neighbour offsets
+    for dy, dx in half_neighbor_offsets:
+        # The rows and columns of the cells from which the edges originate
+        source_rows = slice(0, rows - dy)
+        source_columns = slice(max(0, -dx), columns - max(0, dx))
+        # The rows and columns of the cells at which the edges end
+        target_rows = slice(dy, rows)
+        target_columns = slice(max(0, dx), columns + min(0, dx))
+        # An edge only exists if both of its cells are free
+        both_free = free_mask[source_rows, source_columns] & free_mask[target_rows, target_columns]
+        # We add the source and target cells of the edges
+        sources.append(cell_indices[source_rows, source_columns][both_free])
+        targets.append(cell_indices[target_rows, target_columns][both_free])
+        # All the edges along this offset share the same step cost
+        costs.append(np.full(np.count_nonzero(both_free), math.sqrt(dy ** 2 + dx ** 2)))
+    # Returns the graph as a sparse adjacency matrix
+    return csr_matrix((np.concatenate(costs), (np.concatenate(sources), np.concatenate(targets))),
+                      shape=(rows * columns, rows * columns))
+
+
+# Computes the exact grid distances from each of the source coordinates to every cell as float32 arrays
+def grid_distances(free_mask, source_list, grid_graph=None):
+    # We import scipy on first use as it is slow to load
+    from scipy.sparse import csgraph
+    # We build the grid graph if one wasn't provided
+    if grid_graph is None:
+        grid_graph = build_grid_graph(free_mask)
+    # The array which will hold a distance layer for each source (unreachable cells are infinite)
+    distances = np.empty((len(source_list), free_mask.shape[0], free_mask.shape[1]), dtype=np.float32)
+    # Iterating through the sources one at a time to limit the memory of the float64 dijkstra output
+    for i, source in enumerate(source_list):
+        # We run a full dijkstra sweep from the source cell
+        distances[i] = csgraph.dijkstra(grid_graph, directed=False,
+                                        indices=source[0] * free_mask.shape[1] + source[1]).reshape(free_mask.shape)
+    # Returns the distance layers
+    return distances
+
+
+# Obtains the A* path from start to goal as A* returns it from the goal back to the cell two steps from the start
+def a_star_path(map_matrix, path, start, goal):
+    # We reverse the path and represent its coordinates as tuples
+    path = [(int(coordinate[0]), int(coordinate[1])) for coordinate in path[::-1]]
+    # A* leaves out the cell after the start which is a free neighbour of both the start and the next cell
+    if path and max(abs(path[0][0] - start[0]), abs(path[0][1] - start[1])) > 1:
+        # The neighbours of the start that lie in the map and are free
+        neighbor_list = [(start[0] + dy, start[1] + dx) for dy in (-1, 0, 1) for dx in (-1, 0, 1) if dy or dx]
+        neighbor_list = [neighbor for neighbor in neighbor_list if 0 <= neighbor[0] < map_matrix.shape[0] and
+                         0 <= neighbor[1] < map_matrix.shape[1] and map_matrix[neighbor[0], neighbor[1]] > 0 and
+                         max(abs(neighbor[0] - path[0][0]), abs(neighbor[1] - path[0][1])) <= 1]
+        # We bridge the gap through the neighbour with the shortest two steps
+        path.insert(0, min(neighbor_list, key=lambda neighbor: math.hypot(neighbor[0] - start[0],
+                                                                         neighbor[1] - start[1]) +
+                           math.hypot(path[0][0] - neighbor[0], path[0][1] - neighbor[1])))
+    # Returns the path with the start and goal at its ends
+    return path_with_ends(path, start, goal)
+
+
+# Obtains the path with the start as its first coordinate and the goal as its last
+def path_with_ends(path, start, goal):
+    # We represent the coordinates as tuples
+    path = [(int(coordinate[0]), int(coordinate[1])) for coordinate in path]
+    # We add the start and goal if the planner left them out
+    if not path or path[0] != tuple(start):
+        path.insert(0, tuple(start))
+    if path[-1] != tuple(goal):
+        path.append(tuple(goal))
+    # Returns the path
+    return path
@@ -3,13 +3,14 @@
 # Date: 3/9/2019
 
 # importing the necessary modules
-import matplotlib.lines as lines
 import numpy as np
 import copy
 
 
 # This function helps to plot lines via the plot axis handle and the path provided list of - (y,x)
 def plot_lines(axis, path, colour='red', line_style='-'):
+    # We import matplotlib on first use as it is slow to load
+    import matplotlib.lines as lines
     # Check if the path is empty
     if len(path) < 2:
         # Returns from the function
@@ -30,6 +31,8 @@ def plot_lines(axis, path, colour='red', line_style='-'):
 
 # This function plots lines between sets of two points via the plot axis handle - list of [(y1,x1), (y2,x2)]
 def plot_branches(axis, branches, colour='orange', line_style='-'):
+    # We import matplotlib on first use as it is slow to load
+    import matplotlib.lines as lines
     # Iterating through the coordinates in the branches list
     for coordinate in branches:
         # Obtaining the line to be plotted
@@ -41,6 +44,8 @@ def plot_branches(axis, branches, colour='orange', line_style='-'):
 
 # This function specializes in plotting the edges of the Integrated PRM
 def plot_edges_prm(axis, roadmap_edge_list, colour='orange', line_style_free='-', line_style_blocked=':'):
+    # We import matplotlib on first use as it is slow to load
+    import matplotlib.lines as lines
     # Iterating through the edges in the roadmap edge list
     for edge in roadmap_edge_list:
         # We initialize the line style to the default
@@ -3,35 +3,35 @@
 # Date 3/9/2019
 
 # importing user defined modules
-from IntegratedPRM import IntegratedPRM
-from DynamicObstacle import DynamicObstacle
-import a_star
-import rrt
-import line_plotter
+from .IntegratedPRM import IntegratedPRM
+from .DynamicObstacle import DynamicObstacle
+from .LandmarkHeuristic import LandmarkHeuristic
+from .OccupancyGrid import OccupancyGrid
+from . import a_star
+from . import rrt
+from . import line_plotter
 
 # importing all the necessary modules
-from PIL import Image
 import numpy as np
-import matplotlib.pyplot as plot
 import time
 import math
 import random
 import os
 
-# Closes all pre-existing figures
-plot.close("all")
-# Obtains the path to the current working directory
-directory_main = os.getcwd()
+# Obtains the path to the directory holding this file
+directory_main = os.path.dirname(os.path.abspath(__file__))
 # The directory from which we may load maps
-directory_maps = directory_main + '\Maps\\'
+directory_maps = os.path.join(directory_main, 'Maps')
 # The directory from which we may load dynamic obstacles
-directory_obstacles = directory_main + '\obstacles\\'
+directory_obstacles = os.path.join(directory_main, 'Obstacles')
 
 # --------------------------------- Hyper parameters ---------------------------------
-# Setting the random seed to ensure results don't change too much
-random.seed(1)
+# The random seed to ensure results don't change too much
+random_seed = 1
 # The list of maps to load
 maps_to_load = 'map_4'
+# The storage of the loaded map which can be 'uint8', 'bits' or 'tiled' (memory-mapped tiles for very large maps)
+map_storage = 'uint8'
 # The coordinate to start from
 start_coordinate = (0, 0)
 # The coordinate to end at
@@ -42,34 +42,64 @@ obstacle_load_count = 1
 obstacles_to_load = ['obstacle_1', 'obstacle_2', 'obstacle_6']
 # The coordinates over which the dynamic obstacle will be placed and scale into [(y1, x1), (y2, x2)]
 obstacles_loaded_coordinates = [[(80, 50), (100, 100)], [(350, 300), (450, 400)], [(300, 80), (410, 180)]]
+# The robot radius (or footprint mask) by which obstacles are inflated (None plans for a point robot)
+robot_footprint = None
 # ---------- PRM and RRT Parameters -----------
 # The PRM node density
 prm_node_density = 12
 # The PRM node neighbors
 prm_node_neighbors = 10
+# The stretch factor by which the PRM roadmap is pruned into a spanner (None keeps every edge)
+prm_spanner_stretch = None
 # The RRT growth limit
 rrt_growth_limit = 10
 # The RRT distance required to identify goal
 rrt_goal_distance = 10
+# The number of landmarks used for the A* heuristic (zero uses the euclidean heuristic alone)
+a_star_landmark_count = 8
 # ------------------------------------------------------------------------------------
 
 
-# If this file is the main one called for execution
-if __name__ == "__main__":
+# Runs the three planners on the map and plots their results side by side
+def main():
 
-    # Reads in the bitmap world images (obstacles are zeros and free space are ones)
-    world_map = Image.open(directory_maps + maps_to_load + '.bmp')
-    # Converts the image into a numpy array
-    world_map = np.abs(np.array(world_map))*255
+    # We import PIL and matplotlib on first use as they are slow to load
+    from PIL import Image
+    import matplotlib.pyplot as plot
+    # Closes all pre-existing figures
+    plot.close("all")
+    # Setting the random seed to ensure results don't change too much
+    random.seed(random_seed)
+
+    # Reads in the bitmap world images into an occupancy grid (obstacles are zeros and free space are ones)
+    world_map = OccupancyGrid.from_image(os.path.join(directory_maps, maps_to_load + '.bmp'), map_storage,
+                                         os.path.join(directory_maps, maps_to_load + '.occ'))
+    # Obtains the world map as an array of ones and zeros for plotting
+    world_map_array = world_map.to_array()
     # Creates an RGB Version of the world map
-    world_map_rgb = line_plotter.concat_channels(world_map, world_map, world_map)
+    world_map_rgb = line_plotter.concat_channels(world_map_array, world_map_array, world_map_array, 255)
+
+    # ---------- Loading the A* landmark tables ----------
+    # The landmark tables are computed on the static map and persisted alongside it
+    landmark_heuristic = None
+    # We check if the landmark heuristic is to be used
+    if a_star_landmark_count > 0:
+        # We record the start time
+        start_time = time.time()
+        # We load the persisted landmark tables or compute them if the map has changed
+        landmark_heuristic = LandmarkHeuristic.load_or_build(world_map,
+                                                             os.path.join(directory_maps, maps_to_load + '.bmp'),
+                                                             a_star_landmark_count)
+        # We print the computation time needed for loading the landmark tables
+        print('Time needed to load A* landmark tables: ' + format(time.time()-start_time, '.2f') + ' seconds')
 
     # ---------- Initializing the integrated PRM algorithm ----------
     # We record the start time
     start_time = time.time()
     # We create an object of the integrated PRM algorithm
     integrated_prm = IntegratedPRM(world_map, mode='density',
-                                   node_value=prm_node_density, node_neighbors=prm_node_neighbors)
+                                   node_value=prm_node_density, node_neighbors=prm_node_neighbors,
+                                   robot_footprint=robot_footprint, spanner_stretch=prm_spanner_stretch)
     # We print the computation time needed for setting up the probabilistic roadmap
     print('Time needed to initialize integrated PRM roadmap: ' + format(time.time()-start_time, '.2f') + ' seconds')
 
@@ -81,7 +111,7 @@ if __name__ == "__main__":
         # We create an dynamic obstacle object
         dynamic_obstacle = DynamicObstacle([])
         # Reads in the bitmap images of the obstacles
-        obstacle_image = Image.open(directory_obstacles + obstacles_to_load[i] + '.bmp')
+        obstacle_image = Image.open(os.path.join(directory_obstacles, obstacles_to_load[i] + '.bmp'))
         # Converts the obstacle image into a numpy array
         obstacle_image = np.abs(np.array(obstacle_image)-1)
         # The coordinates between which the obstacle should be scaled to fit
@@ -130,9 +160,13 @@ if __name__ == "__main__":
     figure.suptitle('Results for map: ' + maps_to_load + ' with ' + repr(obstacle_load_count) + ' obstacles introduced')
 
     # ---------- A* Algorithm ----------
+    # With a robot footprint every planner stamps the dynamic obstacles into the configuration space of the roadmap
+    # rather than inflating the whole world map again
+    configuration_space = integrated_prm.configuration_space
     # Uses the A_star algorithm to find the shortest route to the goal
-    path, path_length, computation_time, coordinates_expanded = a_star.find_path(world_map, start_coordinate,
-                                                                                 end_coordinate)
+    path, path_length, computation_time, coordinates_expanded = a_star.find_path(
+        world_map, start_coordinate, end_coordinate, landmark_heuristic, configuration_space=configuration_space,
+        dynamic_obstacle_list=dynamic_obstacle_list)
     # Adds lines to the plot
     line_plotter.plot_lines(axis[0], path, 'red')
     # We mark orange for all the coordinates expanded by the A* algorithm
@@ -153,9 +187,9 @@ if __name__ == "__main__":
 
     # ---------- RRT Algorithm ----------
     # Uses the RRT algorithm to find a path to the destination
-    path, path_length, computation_time, branch_set, node_count = rrt.find_path(world_map, start_coordinate,
-                                                                                end_coordinate, rrt_growth_limit,
-                                                                                rrt_goal_distance)
+    path, path_length, computation_time, branch_set, node_count = rrt.find_path(
+        world_map, start_coordinate, end_coordinate, rrt_growth_limit, rrt_goal_distance,
+        configuration_space=configuration_space, dynamic_obstacle_list=dynamic_obstacle_list)
     # Adds rrt branch lines to the plot
     line_plotter.plot_branches(axis[1], branch_set, 'orange')
     # Adds rrt path lines to the plot
@@ -201,3 +235,7 @@ if __name__ == "__main__":
     # Display the plot
     plot.show()
 
+
+# If this file is the main one called for execution
+if __name__ == "__main__":
+    main()
@@ -3,7 +3,7 @@
 # Date: 3/9/2019
 
 # importing the necessary modules
-from scipy import spatial
+from .ConfigurationSpace import planning_map
 import numpy as np
 import random
 import math
@@ -62,11 +62,18 @@ def check_hit(map_matrix, start_coordinate, end_coordinate):
 
 
 # Finds the path via RRT algorithm and returns the path, distance to goal and the computation time
+# robot_footprint is an optional robot radius or footprint mask against whose cached configuration space we plan
+# configuration_space is an optional ConfigurationSpace of the static map into which dynamic_obstacle_list is stamped
 def find_path(map_matrix, start, goal, rrt_growth_limit, terminal_goal_distance,
-              rrt_goal_epsilon=0.1, rrt_maximum_nodes=10000):
+              rrt_goal_epsilon=0.1, rrt_maximum_nodes=10000, robot_footprint=None, configuration_space=None,
+              dynamic_obstacle_list=None):
 
     # We measure the time at start
     start_time = time.time()
+    # We plan over the map with obstacles inflated by the footprint if the robot has one
+    map_matrix = planning_map(map_matrix, robot_footprint, configuration_space, dynamic_obstacle_list)
+    # We import scipy on first use as it is slow to load
+    from scipy import spatial
     # We initalize the node list with the start coordinates
     node_list = [start]
     # We initalize the node parent list that tells child nodes where it connects (key-value pair)
@@ -0,0 +1,104 @@
+# Tests of the path cache of the integrated PRM and the index of the edges its paths use
+# Created by the Dynamic Path Planner contributors
+# Date: 10/19/2026
+
+# importing the necessary modules
+from dynamic_path_planner.IntegratedPRM import IntegratedPRM
+from dynamic_path_planner.DynamicObstacle import DynamicObstacle
+import numpy as np
+import random
+
+
+# Builds a roadmap with a path cache over an open map with a wall that paths have to go around
+def build_roadmap(path_cache_size):
+    # The map with obstacles as zeros
+    world_map = np.full((80, 80), 255, dtype=np.uint8)
+    world_map[20:60, 40] = 0
+    # We seed the random number generator so that the roadmap is repeatable
+    random.seed(3)
+    # Returns the map and the roadmap
+    return world_map, IntegratedPRM(world_map, node_value=6, path_cache_size=path_cache_size)
+
+
+# Runs random queries between free cells of the map on the roadmap
+def run_queries(integrated_prm, world_map, query_count, seed):
+    # The random number generator of the queries
+    random_generator = random.Random(seed)
+    # We obtain the free cells of the map
+    free_cells = [tuple(int(value) for value in cell) for cell in np.argwhere(world_map > 0)]
+    # Iterating through the queries
+    for _ in range(query_count):
+        integrated_prm.find_path(world_map, [], random_generator.choice(free_cells), random_generator.choice(free_cells))
+
+
+# Checks that the index holds exactly the edges of the cached paths and only keys that are still cached
+def assert_index_consistent(integrated_prm):
+    # The index expected from the cached paths
+    expected_index = {}
+    for key, (_, _, edge_id_list) in integrated_prm.path_cache.items():
+        for edge_id in edge_id_list:
+            expected_index.setdefault(edge_id, set()).add(key)
+    # The index must match it exactly
+    assert integrated_prm.path_cache_edge_dict == expected_index
+
+
+# The index shrinks along with the cache as least recently used paths are evicted
+def test_index_is_bounded_by_the_cache():
+    # We build the roadmap with a small cache
+    world_map, integrated_prm = build_roadmap(4)
+    # We run many more queries than the cache holds
+    run_queries(integrated_prm, world_map, 60, 0)
+    # The cache is full but not larger than its size
+    assert len(integrated_prm.path_cache) == 4
+    # The index only refers to the paths still in the cache
+    assert_index_consistent(integrated_prm)
+
+
+# Blocking an edge evicts the cached paths that use it and removes them from the index of their other edges
+def test_blocked_edge_evicts_dependent_paths():
+    # We build the roadmap with a cache large enough to keep every query
+    world_map, integrated_prm = build_roadmap(100)
+    run_queries(integrated_prm, world_map, 20, 1)
+    # We pick an edge of a cached path
+    key, (_, _, edge_id_list) = next((key, entry) for key, entry in integrated_prm.path_cache.items() if entry[2])
+    edge = next(edge for edge in integrated_prm.roadmap_edge_list if id(edge) == edge_id_list[0])
+    # We place a dynamic obstacle on the middle of the edge and stamp it into a copy of the map
+    middle = ((edge.vertex_1[0] + edge.vertex_2[0]) // 2, (edge.vertex_1[1] + edge.vertex_2[1]) // 2)
+    dynamic_obstacle = DynamicObstacle([middle])
+    blocked_map = world_map.copy()
+    blocked_map[middle] = 0
+    # We update the blockage of the edges
+    integrated_prm.update_edge_list_for_blockage([dynamic_obstacle], blocked_map)
+    # The path that used the edge was evicted
+    assert edge.dynamic_obstacle_overlap
+    assert key not in integrated_prm.path_cache
+    # No cached path uses a blocked edge and the index holds no evicted keys
+    blocked_edge_ids = {id(edge) for edge in integrated_prm.roadmap_edge_list if edge.dynamic_obstacle_overlap}
+    assert all(not blocked_edge_ids.intersection(entry[2]) for entry in integrated_prm.path_cache.values())
+    assert_index_consistent(integrated_prm)
+
+
+# A query that starts on a roadmap node caches the whole node path so later queries attached to the node reuse it
+def test_query_starting_on_a_roadmap_node_caches_the_node():
+    # We build the roadmap with a cache and an identical one without
+    world_map, integrated_prm = build_roadmap(100)
+    _, uncached_prm = build_roadmap(0)
+    goal = (70, 70)
+    # We pick a roadmap node and a free cell next to it that attaches to the same node
+    for node in integrated_prm.roadmap_node_list:
+        neighbor = next((cell for cell in [(node[0] + dy, node[1] + dx) for dy in (-1, 0, 1) for dx in (-1, 0, 1)]
+                         if cell != node and 0 <= cell[0] < 80 and 0 <= cell[1] < 80 and world_map[cell] > 0 and
+                         min(integrated_prm.find_roadmap_attachments(world_map, cell).values(),
+                             key=lambda attachment: attachment[1])[0] == node), None)
+        if neighbor is not None and integrated_prm.find_path(world_map, [], node, goal)[0]:
+            break
+    # The path cached from the node holds the node itself
+    node_path, _, edge_id_list = next(iter(integrated_prm.path_cache.values()))
+    assert node_path[0] == node
+    assert len(edge_id_list) == len(node_path) - 1
+    # The query from the neighbouring cell is served from the cache and matches the roadmap without a cache
+    path, path_length = integrated_prm.find_path(world_map, [], neighbor, goal)[:2]
+    uncached_path, uncached_path_length = uncached_prm.find_path(world_map, [], neighbor, goal)[:2]
+    assert path == uncached_path and path[:2] == [neighbor, node]
+    assert abs(path_length - uncached_path_length) < 1e-9
+    assert_index_consistent(integrated_prm)